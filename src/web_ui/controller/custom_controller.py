@@ -2,7 +2,7 @@ import inspect
 import logging
 import os
 from collections.abc import Awaitable, Callable
-from typing import Any, TypeVar
+from typing import Any, Self, TypeVar
 
 from browser_use.agent.views import ActionModel, ActionResult
 from browser_use.browser.context import BrowserContext
@@ -36,6 +36,24 @@ class CustomController(Controller):
         self.ask_assistant_callback = ask_assistant_callback
         self.mcp_client = None
         self.mcp_server_config = None
+        # Action model built from the registry; cleared when MCP tools are set up or closed
+        self._action_model: type[ActionModel] | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # Always stop MCP server subprocesses, even when the body raised
+        await self.close_mcp_client()
+
+    def create_action_model(self) -> type[ActionModel]:
+        """
+        Build the unfiltered ActionModel covering every registered action, reusing it
+        until the MCP tools are set up or closed.
+        """
+        if self._action_model is None:
+            self._action_model = self.registry.create_action_model()
+        return self._action_model
 
     def _register_custom_actions(self):
         """Register all custom browser actions"""
@@ -168,6 +186,7 @@ class CustomController(Controller):
             self.mcp_client = await setup_mcp_client_and_tools(self.mcp_server_config)
             if self.mcp_client:
                 await self.register_mcp_tools()
+                self._action_model = None
                 logger.info("MCP client setup completed successfully")
             else:
                 logger.warning("MCP client setup failed")
@@ -221,6 +240,7 @@ class CustomController(Controller):
                 logger.error(f"Error closing MCP client: {e}", exc_info=True)
             finally:
                 self.mcp_client = None
+        self._action_model = None
 
     async def reload_mcp_client(self, mcp_server_config: dict[str, Any] | None = None):
         """
@@ -6,6 +6,9 @@ DEFAULT_SETTINGS_FILE = "./data/default_settings.json"
 SETTINGS_ARCHIVE_DIR = "./data/saved_configs"
 OLD_SETTINGS_DIR = "./tmp/webui_settings"
 
+# Names accepted by --theme; must match the keys of interface.theme_map
+THEME_NAMES = ("Default", "Soft", "Monochrome", "Glass", "Origin", "Citrus", "Ocean", "Base")
+
 PROVIDER_DISPLAY_NAMES = {
     "openai": "OpenAI",
     "azure_openai": "Azure OpenAI",
@@ -144,6 +147,21 @@ def ensure_settings_directories():
     os.makedirs(SETTINGS_ARCHIVE_DIR, exist_ok=True)
 
 
+# Substrings marking component IDs that hold runtime-only data
+_RUNTIME_PATTERNS = (
+    "chat_history",
+    "current_task",
+    "agent_task_id",
+    "task_id",
+    "save_dir",
+    "response_event",
+    "user_help_response",
+    "chatbot",
+    "visible",
+    "file",  # File uploads
+)
+
+
 def is_runtime_component(comp_id: str) -> bool:
     """
     Check if a component ID represents runtime-only data that shouldn't be saved.
@@ -154,16 +172,5 @@ def is_runtime_component(comp_id: str) -> bool:
     Returns:
         True if component is runtime-only and should be excluded from saves
     """
-    runtime_patterns = [
-        "chat_history",
-        "current_task",
-        "agent_task_id",
-        "task_id",
-        "save_dir",
-        "response_event",
-        "user_help_response",
-        "chatbot",
-        "visible",
-        "file",  # File uploads
-    ]
-    return any(pattern in comp_id.lower() for pattern in runtime_patterns)
+    comp_id = comp_id.lower()
+    return any(pattern in comp_id for pattern in _RUNTIME_PATTERNS)
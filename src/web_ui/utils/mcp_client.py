@@ -1,4 +1,5 @@
 import inspect
+import json
 import logging
 import uuid
 from datetime import date, datetime, time
@@ -12,6 +13,9 @@ from pydantic import BaseModel, Field, create_model
 
 logger = logging.getLogger(__name__)
 
+# Param models built from JSON schemas, keyed by (tool name, canonical schema JSON)
+_PARAM_MODEL_CACHE: dict[tuple[str, str], type[BaseModel]] = {}
+
 
 async def setup_mcp_client_and_tools(
     mcp_server_config: dict[str, Any],
@@ -53,6 +57,18 @@ def create_tool_param_model(tool: BaseTool) -> type[BaseModel]:
     json_schema = tool.args_schema
     tool_name = tool.name
 
+    # MCP tools carry plain JSON schemas; reuse the model built for an identical one
+    cache_key = None
+    if isinstance(json_schema, dict):
+        try:
+            cache_key = (tool_name, json.dumps(json_schema, sort_keys=True))
+        except TypeError:
+            cache_key = None
+        else:
+            cached_model = _PARAM_MODEL_CACHE.get(cache_key)
+            if cached_model is not None:
+                return cached_model
+
     # If the tool already has a schema defined, convert it to a new param_model
     if json_schema is not None:
         # Create new parameter model
@@ -93,11 +109,14 @@ def create_tool_param_model(tool: BaseTool) -> type[BaseModel]:
                 # Add to parameters dictionary
                 params[prop_name] = (field_type, Field(**field_kwargs))
 
-        return create_model(
+        param_model = create_model(
             f"{tool_name}_parameters",
             __base__=ActionModel,
             **params,  # type: ignore
         )
+        if cache_key is not None:
+            _PARAM_MODEL_CACHE[cache_key] = param_model
+        return param_model
 
     # If no schema is defined, extract parameters from the _run method
     run_method = tool._run
@@ -10,11 +10,16 @@ import os
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Default MCP configuration file location
 DEFAULT_MCP_CONFIG_PATH = Path("./data/mcp.json")
 
+# Parsed configs keyed by path, tagged with the file's (mtime, size) when parsed
+_config_cache: dict[Path, tuple[tuple[int, int], dict[str, Any] | None]] = {}
+
 
 def get_mcp_config_path() -> Path:
     """
@@ -40,6 +45,39 @@ def validate_mcp_config(config: dict[str, Any]) -> tuple[bool, str | None]:
     Args:
         config: MCP configuration dictionary
 
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    return _validate_mcp_config(config, None)
+
+
+def validate_mcp_config_with_summary(config: dict[str, Any]) -> tuple[bool, str | None, str]:
+    """
+    Validate MCP configuration and build its summary in the same pass.
+
+    Args:
+        config: MCP configuration dictionary
+
+    Returns:
+        Tuple of (is_valid, error_message, summary); summary is empty when invalid
+    """
+    summary_lines: list[str] = []
+    is_valid, error_msg = _validate_mcp_config(config, summary_lines)
+    if not is_valid:
+        return False, error_msg, ""
+    return True, None, _format_mcp_config_summary(summary_lines)
+
+
+def _validate_mcp_config(
+    config: dict[str, Any], summary_lines: list[str] | None
+) -> tuple[bool, str | None]:
+    """
+    Validate MCP configuration, stopping at the first error.
+
+    Args:
+        config: MCP configuration dictionary
+        summary_lines: If given, a summary line is appended for each valid server
+
     Returns:
         Tuple of (is_valid, error_message)
     """
@@ -88,6 +126,9 @@ def validate_mcp_config(config: dict[str, Any]) -> tuple[bool, str | None]:
                 if not isinstance(value, str):
                     return False, f"Server '{server_name}' env['{key}'] must be a string"
 
+        if summary_lines is not None:
+            summary_lines.append(f"  - {server_name}: {server_config['command']}")
+
     return True, None
 
 
@@ -109,8 +150,8 @@ def load_mcp_config(config_path: Path | None = None) -> dict[str, Any] | None:
         return None
 
     try:
-        with open(config_path, encoding="utf-8") as f:
-            config = json.load(f)
+        # One bulk read; orjson parses the raw UTF-8 bytes without decoding to str
+        config = orjson.loads(config_path.read_bytes())
 
         # Validate configuration
         is_valid, error_msg = validate_mcp_config(config)
@@ -129,13 +170,48 @@ def load_mcp_config(config_path: Path | None = None) -> dict[str, Any] | None:
         return None
 
 
-def save_mcp_config(config: dict[str, Any], config_path: Path | None = None) -> bool:
+def load_mcp_config_cached(config_path: Path | None = None) -> dict[str, Any] | None:
+    """
+    Load MCP configuration, re-parsing only when the file has changed on disk.
+
+    Saves change the file's mtime, so callers never need to invalidate. The
+    returned dict is shared between callers and must not be mutated.
+
+    Args:
+        config_path: Optional path to configuration file. If None, uses default path.
+
+    Returns:
+        MCP configuration dictionary or None if file doesn't exist or is invalid
+    """
+    if config_path is None:
+        config_path = get_mcp_config_path()
+
+    try:
+        stat = config_path.stat()
+    except OSError:
+        _config_cache.pop(config_path, None)
+        return None
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache.get(config_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    config = load_mcp_config(config_path)
+    _config_cache[config_path] = (key, config)
+    return config
+
+
+def save_mcp_config(
+    config: dict[str, Any], config_path: Path | None = None, *, assume_valid: bool = False
+) -> bool:
     """
     Save MCP configuration to file.
 
     Args:
         config: MCP configuration dictionary
         config_path: Optional path to configuration file. If None, uses default path.
+        assume_valid: Skip validation when the caller has just validated the config
 
     Returns:
         True if saved successfully, False otherwise
@@ -144,18 +220,18 @@ def save_mcp_config(config: dict[str, Any], config_path: Path | None = None) ->
         config_path = get_mcp_config_path()
 
     # Validate before saving
-    is_valid, error_msg = validate_mcp_config(config)
-    if not is_valid:
-        logger.error(f"Cannot save invalid MCP configuration: {error_msg}")
-        return False
+    if not assume_valid:
+        is_valid, error_msg = validate_mcp_config(config)
+        if not is_valid:
+            logger.error(f"Cannot save invalid MCP configuration: {error_msg}")
+            return False
 
     try:
         # Create parent directories if they don't exist
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save with pretty printing
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        # Save with pretty printing in a single write
+        config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Successfully saved MCP configuration to {config_path}")
         return True
@@ -227,16 +303,25 @@ def get_mcp_config_summary(config: dict[str, Any]) -> str:
     Returns:
         Summary string
     """
-    server_names = get_mcp_server_names(config)
+    servers = config.get("mcpServers", config)
+    return _format_mcp_config_summary(
+        [
+            f"  - {name}: {servers[name].get('command', 'unknown')}"
+            for name in get_mcp_server_names(config)
+        ]
+    )
 
-    if not server_names:
-        return "No MCP servers configured"
 
-    summary = f"MCP Servers ({len(server_names)}):\n"
-    for name in server_names:
-        servers = config.get("mcpServers", config)
-        server_config = servers[name]
-        command = server_config.get("command", "unknown")
-        summary += f"  - {name}: {command}\n"
+def _format_mcp_config_summary(summary_lines: list[str]) -> str:
+    """
+    Join per-server summary lines under the summary header.
 
-    return summary.strip()
+    Args:
+        summary_lines: One "  - name: command" line per server
+
+    Returns:
+        Summary string
+    """
+    if not summary_lines:
+        return "No MCP servers configured"
+    return f"MCP Servers ({len(summary_lines)}):\n" + "\n".join(summary_lines)
@@ -1,5 +1,6 @@
 import base64
 import os
+import re
 import time
 from pathlib import Path
 
@@ -34,3 +35,15 @@ def get_latest_files(directory: str, file_types: list | None = None) -> dict[str
             print(f"Error getting latest {file_type} file: {e}")
 
     return latest_files
+
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};])\s*")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a CSS stylesheet."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    return _CSS_PUNCT_SPACE_RE.sub(r"\1", css).strip()
@@ -0,0 +1,92 @@
+// Force the dark theme on load; this used to run as the Blocks js= hook
+(function refresh() {
+    const url = new URL(window.location);
+    if (url.searchParams.get('__theme') !== 'dark') {
+        url.searchParams.set('__theme', 'dark');
+        window.location.href = url.href;
+    }
+})();
+
+// Loaded with defer, so the document is parsed by the time this runs. Gradio
+// mounts its components later; buttons are looked up lazily on first use.
+(function() {
+    // Shortcut buttons, resolved on first use and re-queried only once Gradio
+    // has detached them, so a keystroke does not walk the whole DOM
+    const buttonCache = {};
+    function findButton(name) {
+        let button = buttonCache[name];
+        if (!button || !button.isConnected) {
+            button = document.querySelector('button[id*="' + name + '"]');
+            buttonCache[name] = button;
+        }
+        return button;
+    }
+
+    // Keyboard shortcuts
+    document.addEventListener('keydown', function(e) {
+        // Holding a key down should not click the button again on every repeat
+        if (e.repeat) return;
+
+        let name = null;
+        switch (e.key) {
+            case 'Enter':
+                // Ctrl/Cmd + Enter to submit
+                if ((e.ctrlKey || e.metaKey) && e.target.matches('textarea')) name = 'run';
+                break;
+            case 'Escape':
+                // Escape to stop
+                if (!e.target.matches('input, textarea')) name = 'stop';
+                break;
+            case '?':
+                // ? to show help
+                if (!e.target.matches('input, textarea')) name = 'help';
+                break;
+        }
+        if (name === null) return;
+
+        const button = findButton(name);
+        if (button) button.click();
+    }, { passive: true });
+
+    // Notification system
+    const notificationIcons = {
+        success: '✓',
+        info: 'ℹ',
+        warning: '⚠',
+        error: '✕'
+    };
+    const notificationContainer = document.createElement('div');
+    notificationContainer.id = 'notification-container';
+    document.body.appendChild(notificationContainer);
+
+    // Notifications raised in the same frame are inserted with a single append
+    let pendingNotifications = null;
+    function flushNotifications() {
+        notificationContainer.appendChild(pendingNotifications);
+        pendingNotifications = null;
+    }
+
+    window.showNotification = function(type, title, message, duration) {
+        duration = duration || 5000;
+
+        const notification = document.createElement('div');
+        notification.className = 'notification notification-' + type;
+        notification.innerHTML = `
+            <div style="font-size: 24px;">${notificationIcons[type] || 'ℹ'}</div>
+            <div style="flex: 1;">
+                <strong>${title}</strong>
+                <p style="margin: 4px 0 0 0; font-size: 0.9em; opacity: 0.8;">${message}</p>
+            </div>
+            <button onclick="this.parentElement.remove()" style="background: none; border: none; font-size: 24px; cursor: pointer; opacity: 0.5;">×</button>
+        `;
+        if (pendingNotifications === null) {
+            pendingNotifications = document.createDocumentFragment();
+            requestAnimationFrame(flushNotifications);
+        }
+        pendingNotifications.appendChild(notification);
+
+        setTimeout(function() {
+            notification.remove();
+        }, duration);
+    };
+})();
@@ -333,11 +333,11 @@ async def run_agent_task(
     # Access settings values via components dict, getting IDs from webui_manager
     def get_setting(key, default=None):
         # Try dashboard_settings first (primary namespace), then fall back to agent_settings
-        comp = webui_manager.id_to_component.get(f"dashboard_settings.{key}")
+        comp = webui_manager.find_component_by_id(f"dashboard_settings.{key}")
         if comp:
             return components.get(comp, default)
         # Fallback to agent_settings for backward compatibility
-        comp = webui_manager.id_to_component.get(f"agent_settings.{key}")
+        comp = webui_manager.find_component_by_id(f"agent_settings.{key}")
         return components.get(comp, default) if comp else default
 
     override_system_prompt = get_setting("override_system_prompt") or None
@@ -365,7 +365,7 @@ async def run_agent_task(
 
     # If no file config, fall back to UI textbox
     if mcp_server_config is None:
-        mcp_server_config_comp = webui_manager.id_to_component.get(
+        mcp_server_config_comp = webui_manager.find_component_by_id(
             "agent_settings.mcp_server_config"
         )
         mcp_server_config_str = (
@@ -403,7 +403,7 @@ async def run_agent_task(
 
     # --- Browser Settings ---
     def get_browser_setting(key, default=None):
-        comp = webui_manager.id_to_component.get(f"browser_settings.{key}")
+        comp = webui_manager.find_component_by_id(f"browser_settings.{key}")
         return components.get(comp, default) if comp else default
 
     browser_binary_path = get_browser_setting("browser_binary_path") or None
@@ -572,7 +572,7 @@ async def run_agent_task(
 
         # --- 6. Run Agent Task and Stream Updates ---
         agent_run_coro = webui_manager.bu_agent.run(max_steps=max_steps)
-        agent_task = asyncio.create_task(agent_run_coro)
+        agent_task = webui_manager.start_agent_task(agent_run_coro)
         webui_manager.bu_current_task = agent_task  # Store the task
 
         # Yield progress update
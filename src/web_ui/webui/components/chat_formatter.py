@@ -3,8 +3,94 @@ Chat message formatting utilities for enhanced display.
 """
 
 import re
+from functools import lru_cache
 from typing import Any
 
+# Translation table for escaping code payloads in a single C-level pass
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+_URL_RE = re.compile(r'https?://[^\s<>"]+|www\.[^\s<>"]+')
+_CODE_BLOCK_RE = re.compile(r"```(\w+)?\n(.*?)```", re.DOTALL)
+_INLINE_CODE_RE = re.compile(r"`([^`\n]+)`")
+
+# Code blocks, inline code and URLs fused into one alternation so a message is
+# tokenized in a single left-to-right pass. Code spans take precedence, so URLs
+# inside code are rendered as (escaped) text rather than links.
+_COMBINED_RE = re.compile(
+    r"(?P<block>```(?P<lang>\w+)?\n(?P<code>.*?)```)"
+    r"|(?P<inline>`(?P<inline_code>[^`\n]+)`)"
+    r'|(?P<url>https?://[^\s<>"]+|www\.[^\s<>"]+)',
+    re.DOTALL,
+)
+
+# Precomputed class attributes for common code-block languages
+_LANG_ATTR = {
+    lang: f' class="language-{lang}"'
+    for lang in (
+        "python",
+        "javascript",
+        "typescript",
+        "bash",
+        "sh",
+        "json",
+        "yaml",
+        "html",
+        "css",
+        "sql",
+        "go",
+        "rust",
+        "java",
+        "c",
+        "cpp",
+    )
+}
+
+
+def _render_url(url: str) -> str:
+    # Add https:// if only www. is present
+    full_url = url if url.startswith("http") else f"https://{url}"
+    # Truncate long URLs for display
+    display_url = url if len(url) <= 50 else url[:47] + "..."
+    return f'<a href="{full_url}" target="_blank" rel="noopener noreferrer" class="url-link">{display_url}</a>'
+
+
+def _render_code_block(language: str | None, code: str) -> str:
+    lang_class = _LANG_ATTR.get(language) or (f' class="language-{language}"' if language else "")
+    return f"<pre><code{lang_class}>{code.translate(_HTML_ESCAPE_TABLE)}</code></pre>"
+
+
+def _render_inline_code(code: str) -> str:
+    return f'<code class="inline-code">{code.translate(_HTML_ESCAPE_TABLE)}</code>'
+
+
+def _dispatch(match: re.Match[str]) -> str:
+    kind = match.lastgroup
+    if kind == "block":
+        return _render_code_block(match.group("lang"), match.group("code"))
+    if kind == "inline":
+        return _render_inline_code(match.group("inline_code"))
+    return _render_url(match.group("url"))
+
+
+def _tokenize(text: str) -> str:
+    """Render URLs, code blocks and inline code in one pass over ``text``."""
+    # Plain messages are the common case; C-level substring scans let them skip
+    # the regex engine entirely.
+    if "`" not in text and "http" not in text and "www." not in text:
+        return text
+
+    parts = []
+    append = parts.append
+    last = 0
+    for match in _COMBINED_RE.finditer(text):
+        append(text[last : match.start()])
+        append(_dispatch(match))
+        last = match.end()
+    if not last:
+        return text
+    append(text[last:])
+    return "".join(parts)
+
 
 def format_agent_message(content: str, metadata: dict[str, Any] | None = None) -> str:
     """
@@ -20,26 +106,31 @@ def format_agent_message(content: str, metadata: dict[str, Any] | None = None) -
     if not content:
         return ""
 
-    formatted = content
+    action = None
+    status = "default"
+    collapsible = False
+    if metadata:
+        if "action" in metadata:
+            action = metadata["action"].lower()
+            status = metadata.get("status", "default")
+        collapsible = bool(metadata.get("collapsible"))
 
-    # Add action badge if action metadata is present
-    if metadata and "action" in metadata:
-        action = metadata["action"].lower()
-        status = metadata.get("status", "default")
-        badge_html = create_action_badge(action, status)
-        formatted = badge_html + " " + formatted
+    return _format_cached(content, action, status, collapsible)
 
-    # Make URLs clickable
-    formatted = make_urls_clickable(formatted)
 
-    # Format code blocks
-    formatted = format_code_blocks(formatted)
+@lru_cache(maxsize=256)
+def _format_cached(content: str, action: str | None, status: str, collapsible: bool) -> str:
+    """Render a message from hashable metadata so repeated messages hit the cache."""
+    # Make URLs clickable and format code blocks / inline code
+    formatted = _tokenize(content)
 
-    # Format inline code
-    formatted = format_inline_code(formatted)
+    # Add action badge if action metadata is present
+    if action is not None:
+        badge_html = create_action_badge(action, status)
+        formatted = badge_html + " " + formatted
 
     # Add collapsible sections for long content
-    if len(formatted) > 500 and metadata and metadata.get("collapsible"):
+    if len(formatted) > 500 and collapsible:
         formatted = create_collapsible_section("Details", formatted)
 
     return formatted
@@ -87,17 +178,7 @@ def make_urls_clickable(text: str) -> str:
     Returns:
         Text with URLs converted to HTML links
     """
-    url_pattern = r'(https?://[^\s<>"]+|www\.[^\s<>"]+)'
-
-    def replace_url(match):
-        url = match.group(0)
-        # Add https:// if only www. is present
-        full_url = url if url.startswith("http") else f"https://{url}"
-        # Truncate long URLs for display
-        display_url = url if len(url) <= 50 else url[:47] + "..."
-        return f'<a href="{full_url}" target="_blank" rel="noopener noreferrer" class="url-link">{display_url}</a>'
-
-    return re.sub(url_pattern, replace_url, text)
+    return _URL_RE.sub(lambda match: _render_url(match.group(0)), text)
 
 
 def format_code_blocks(text: str) -> str:
@@ -110,16 +191,9 @@ def format_code_blocks(text: str) -> str:
     Returns:
         Text with formatted code blocks
     """
-    # Match code blocks with optional language
-    pattern = r"```(\w+)?\n(.*?)```"
-
-    def replace_code_block(match):
-        language = match.group(1) or ""
-        code = match.group(2)
-        lang_class = f' class="language-{language}"' if language else ""
-        return f"<pre><code{lang_class}>{code}</code></pre>"
-
-    return re.sub(pattern, replace_code_block, text, flags=re.DOTALL)
+    return _CODE_BLOCK_RE.sub(
+        lambda match: _render_code_block(match.group(1), match.group(2)), text
+    )
 
 
 def format_inline_code(text: str) -> str:
@@ -132,9 +206,7 @@ def format_inline_code(text: str) -> str:
     Returns:
         Text with formatted inline code
     """
-    # Match inline code (single backticks not in code blocks)
-    pattern = r"`([^`\n]+)`"
-    return re.sub(pattern, r'<code class="inline-code">\1</code>', text)
+    return _INLINE_CODE_RE.sub(lambda match: _render_inline_code(match.group(1)), text)
 
 
 def create_collapsible_section(title: str, content: str, collapsed: bool = True) -> str:
@@ -13,6 +13,36 @@ from src.web_ui.webui.webui_manager import WebuiManager
 
 logger = logging.getLogger(__name__)
 
+# Component IDs registered under the legacy tab names; order matches the
+# component tuples zipped against them in create_dashboard_main.
+_BROWSER_USE_KEYS = (
+    "user_input",
+    "run_button",
+    "stop_button",
+    "pause_resume_button",
+    "clear_button",
+    "progress_text",
+    "chatbot",
+    "user_help_row",
+    "user_help_input",
+    "submit_help_button",
+    "browser_view",
+    "recording_gif",
+    "agent_history_file",
+)
+_DEEP_RESEARCH_KEYS = (
+    "research_task",
+    "resume_task_id",
+    "parallel_num",
+    "max_query",
+    "start_button",
+    "stop_button",
+    "clear_button",
+    "markdown_display",
+    "markdown_download",
+    "mcp_server_config",
+)
+
 
 def create_dashboard_main(webui_manager: WebuiManager):
     """
@@ -167,36 +197,48 @@ def create_dashboard_main(webui_manager: WebuiManager):
                 mcp_server_config = gr.Textbox(visible=False)
 
         # Register Browser Use Agent components with old-style IDs for compatibility
-        browser_use_components = {
-            "user_input": user_input,
-            "run_button": run_button,
-            "stop_button": stop_button,
-            "pause_resume_button": pause_resume_button,
-            "clear_button": clear_button,
-            "progress_text": progress_text,
-            "chatbot": chatbot,
-            "user_help_row": user_help_row,
-            "user_help_input": user_help_input,
-            "submit_help_button": submit_help_button,
-            "browser_view": browser_view,
-            "recording_gif": recording_gif,
-            "agent_history_file": agent_history_file,
-        }
+        browser_use_components = dict(
+            zip(
+                _BROWSER_USE_KEYS,
+                (
+                    user_input,
+                    run_button,
+                    stop_button,
+                    pause_resume_button,
+                    clear_button,
+                    progress_text,
+                    chatbot,
+                    user_help_row,
+                    user_help_input,
+                    submit_help_button,
+                    browser_view,
+                    recording_gif,
+                    agent_history_file,
+                ),
+                strict=True,
+            )
+        )
         webui_manager.add_components("browser_use_agent", browser_use_components)
 
         # Register Deep Research Agent components with old-style IDs for compatibility
-        deep_research_components = {
-            "research_task": research_task,
-            "resume_task_id": resume_task_id,
-            "parallel_num": parallel_num,
-            "max_query": max_query,
-            "start_button": start_button,
-            "stop_button": stop_button_dr,
-            "clear_button": clear_button_dr,
-            "markdown_display": markdown_display,
-            "markdown_download": markdown_download,
-            "mcp_server_config": mcp_server_config,
-        }
+        deep_research_components = dict(
+            zip(
+                _DEEP_RESEARCH_KEYS,
+                (
+                    research_task,
+                    resume_task_id,
+                    parallel_num,
+                    max_query,
+                    start_button,
+                    stop_button_dr,
+                    clear_button_dr,
+                    markdown_display,
+                    markdown_download,
+                    mcp_server_config,
+                ),
+                strict=True,
+            )
+        )
         webui_manager.add_components("deep_research_agent", deep_research_components)
 
         # Register dashboard-level components
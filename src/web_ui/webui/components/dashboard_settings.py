@@ -5,112 +5,243 @@ Consolidated settings panel with LLM, Browser, MCP, and Advanced configuration.
 Collapsible by default with toggle button.
 """
 
+import asyncio
 import logging
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
 
 import gradio as gr
 
 from src.web_ui.utils import config
-from src.web_ui.utils.mcp_config import get_mcp_config_path, get_mcp_config_summary, load_mcp_config
+from src.web_ui.utils.mcp_config import (
+    get_mcp_config_path,
+    get_mcp_config_summary,
+    load_mcp_config_cached,
+)
 from src.web_ui.webui.webui_manager import WebuiManager
 
 logger = logging.getLogger(__name__)
 
+_TRUE_VALUES = frozenset({"y", "yes", "t", "true", "on", "1"})
+_FALSE_VALUES = frozenset({"n", "no", "f", "false", "off", "0"})
 
-def strtobool(val):
+# Provider dropdown choices, shared by the primary and planner dropdowns
+_PROVIDER_CHOICES = tuple(config.model_names)
+
+# Model dropdown update per provider; the model lists are static per process
+_MODEL_UPDATES = MappingProxyType(
+    {
+        provider: gr.update(choices=models, value=models[0] if models else "", interactive=True)
+        for provider, models in config.model_names.items()
+    }
+)
+_NO_MODELS_UPDATE = gr.update(choices=[], value="", interactive=True)
+
+_MCP_ACTIVE_TMPL = """
+✅ **MCP Configuration Active**
+
+{summary}
+
+Configuration file: `{path}`
+"""
+_MCP_MISSING_TMPL = """
+ℹ️ **No MCP Configuration**
+
+No MCP servers configured. You can add servers via the MCP Settings editor.
+
+Expected file: `{path}`
+"""
+
+# Visibility toggles only ever produce one of two updates
+_VIS_TRUE = gr.update(visible=True)
+_VIS_FALSE = gr.update(visible=False)
+
+
+# Dashboard settings components also exposed under the legacy agent_settings and
+# browser_settings IDs
+_AGENT_SETTINGS_KEYS = (
+    "override_system_prompt",
+    "extend_system_prompt",
+    "llm_provider",
+    "llm_model_name",
+    "llm_temperature",
+    "use_vision",
+    "llm_base_url",
+    "llm_api_key",
+    "ollama_num_ctx",
+    "planner_llm_provider",
+    "planner_llm_model_name",
+    "planner_llm_temperature",
+    "planner_use_vision",
+    "planner_ollama_num_ctx",
+    "planner_llm_base_url",
+    "planner_llm_api_key",
+    "max_steps",
+    "max_actions",
+    "max_input_tokens",
+    "tool_calling_method",
+    "mcp_json_file",
+    "mcp_server_config",
+)
+_BROWSER_SETTINGS_KEYS = (
+    "browser_binary_path",
+    "browser_user_data_dir",
+    "use_own_browser",
+    "keep_browser_open",
+    "headless",
+    "disable_security",
+    "window_w",
+    "window_h",
+    "cdp_url",
+    "wss_url",
+    "save_recording_path",
+    "save_trace_path",
+    "save_agent_history_path",
+    "save_download_path",
+)
+
+
+def strtobool(val: str) -> int:
     """Convert a string representation of truth to true (1) or false (0)."""
     val = val.lower()
-    if val in ("y", "yes", "t", "true", "on", "1"):
+    if val in _TRUE_VALUES:
         return 1
-    elif val in ("n", "no", "f", "false", "off", "0"):
+    if val in _FALSE_VALUES:
         return 0
-    else:
-        raise ValueError(f"invalid truth value {val!r}")
+    raise ValueError(f"invalid truth value {val!r}")
 
 
-def update_model_dropdown(llm_provider):
-    """Update the model name dropdown with predefined models for the selected provider."""
-    print(f"[DEBUG] update_model_dropdown called with provider: {llm_provider}")
-    logger.info(f"Updating model dropdown for provider: {llm_provider}")
-    logger.info(f"Available providers: {list(config.model_names.keys())}")
-    if llm_provider in config.model_names:
-        models = config.model_names[llm_provider]
-        print(f"[DEBUG] Found {len(models)} models for {llm_provider}: {models}")
-        logger.info(f"Found {len(models)} models for {llm_provider}: {models[:3]}...")
-        result = gr.update(
-            choices=models,
-            value=models[0] if models else "",
-            interactive=True,
-        )
-        print(f"[DEBUG] Returning gr.update with choices: {result.get('choices', 'N/A')}")
-        return result
-    else:
-        print(f"[DEBUG] Provider {llm_provider} not found!")
-        logger.warning(f"Provider {llm_provider} not found in config.model_names")
-        return gr.update(choices=[], value="", interactive=True)
+def _env_bool(name: str, default: str) -> bool:
+    """Parse a boolean environment variable."""
+    return bool(strtobool(os.getenv(name, default)))
 
 
-async def close_browser(webui_manager: WebuiManager):
-    """Close browser when browser config changes."""
-    if webui_manager.bu_current_task and not webui_manager.bu_current_task.done():
-        webui_manager.bu_current_task.cancel()
-        webui_manager.bu_current_task = None
+@dataclass(frozen=True, slots=True)
+class _Defaults:
+    """Environment-derived defaults for the settings panel."""
 
-    if webui_manager.bu_browser_context:
-        logger.info("⚠️ Closing browser context when changing browser config.")
-        await webui_manager.bu_browser_context.close()
-        webui_manager.bu_browser_context = None
+    default_llm: str
+    default_models: tuple[str, ...]
+    use_own_browser: bool
+    keep_browser_open: bool
+    browser_cdp: str | None
 
-    if webui_manager.bu_browser:
-        logger.info("⚠️ Closing browser when changing browser config.")
-        await webui_manager.bu_browser.close()
-        webui_manager.bu_browser = None
 
+@lru_cache(maxsize=1)
+def _get_defaults() -> _Defaults:
+    # Snapshotted on first panel build rather than at import, since .env is
+    # loaded after this module is imported
+    default_llm = os.getenv("DEFAULT_LLM", "openai")
+    return _Defaults(
+        default_llm=default_llm,
+        default_models=tuple(config.model_names.get(default_llm, ())),
+        use_own_browser=_env_bool("USE_OWN_BROWSER", "false"),
+        keep_browser_open=_env_bool("KEEP_BROWSER_OPEN", "true"),
+        browser_cdp=os.getenv("BROWSER_CDP", None),
+    )
 
-def create_dashboard_settings(webui_manager: WebuiManager):
-    """
-    Create the collapsible settings panel with consolidated configuration.
 
-    Args:
-        webui_manager: WebUI manager instance
-    """
-    settings_components = {}
+def toggle_visibility(checked: bool) -> dict[str, Any]:
+    """Show or hide a group from a checkbox value."""
+    return _VIS_TRUE if checked else _VIS_FALSE
 
-    gr.Markdown("## ⚙️ Settings")
 
-    # Save/Load Config at Top
-    with gr.Row():
-        save_config_button = gr.Button("💾 Save", variant="primary", scale=1, size="sm")
-        save_default_button = gr.Button("⭐ Save as Default", variant="primary", scale=1, size="sm")
-        load_config_button = gr.Button("📂 Load", variant="secondary", scale=1, size="sm")
+def update_model_dropdown(llm_provider: str | None) -> dict[str, Any]:
+    """Update the model name dropdown with predefined models for the selected provider."""
+    update = _MODEL_UPDATES.get(llm_provider)
+    if update is None:
+        logger.warning("Provider %s not found in config.model_names", llm_provider)
+        update = _NO_MODELS_UPDATE
+    # Copy so Gradio can't mutate the shared payload
+    return dict(update)
 
-    config_file = gr.File(
-        label="Configuration File",
-        file_types=[".json"],
-        interactive=True,
-        visible=False,
-    )
-    config_status = gr.Textbox(label="Status", lines=1, interactive=False, visible=False)
 
-    gr.Markdown("---")
+def update_provider_settings(llm_provider: str | None) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Update a model dropdown and its Ollama context visibility for a provider change."""
+    return update_model_dropdown(llm_provider), toggle_visibility(llm_provider == "ollama")
+
+
+def get_mcp_status_markdown() -> str:
+    """Build the MCP status markdown, re-reading the config only when the file changes."""
+    mcp_config_path = get_mcp_config_path()
+    mcp_config = load_mcp_config_cached(mcp_config_path)
+
+    if mcp_config and "mcpServers" in mcp_config:
+        summary = get_mcp_config_summary(mcp_config)
+        return _MCP_ACTIVE_TMPL.format(summary=summary, path=mcp_config_path)
+    return _MCP_MISSING_TMPL.format(path=mcp_config_path)
+
 
+async def close_browser(webui_manager: WebuiManager) -> None:
+    """Close browser when browser config changes."""
+    # Several checkboxes toggled in one interaction share a single teardown
+    close_task = webui_manager.bu_close_task
+    if close_task is None or close_task.done():
+        close_task = asyncio.create_task(_close_browser(webui_manager))
+        webui_manager.bu_close_task = close_task
+    await asyncio.shield(close_task)
+
+
+async def _close_browser(webui_manager: WebuiManager) -> None:
+    # Detach everything before the first await so a later close, or a browser
+    # created meanwhile, never sees the references this teardown is closing
+    agent_task = webui_manager.bu_current_task
+    browser_context = webui_manager.bu_browser_context
+    browser = webui_manager.bu_browser
+    webui_manager.bu_current_task = None
+    webui_manager.bu_browser_context = None
+    webui_manager.bu_browser = None
+
+    try:
+        # The agent must stop using the context before it is closed, and the
+        # context before its browser
+        if agent_task and not agent_task.done():
+            agent_task.cancel()
+            try:
+                await agent_task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.warning(f"Agent task failed while stopping: {e}")
+
+        if browser_context:
+            logger.info("⚠️ Closing browser context when changing browser config.")
+            try:
+                await browser_context.close()
+            except Exception as e:
+                logger.warning(f"Error while closing browser context: {e}")
+
+        if browser:
+            logger.info("⚠️ Closing browser when changing browser config.")
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.warning(f"Error while closing browser: {e}")
+    finally:
+        if webui_manager.bu_close_task is asyncio.current_task():
+            webui_manager.bu_close_task = None
+
+
+def _build_llm_section(defaults: _Defaults) -> dict[str, Any]:
+    """Build the LLM accordion, including the optional planner model."""
     # 🤖 LLM Configuration
     with gr.Accordion("🤖 LLM Configuration", open=True):
         gr.Markdown("**Primary language model** for agent reasoning")
 
         with gr.Row():
             llm_provider = gr.Dropdown(
-                choices=[provider for provider, model in config.model_names.items()],
+                choices=_PROVIDER_CHOICES,
                 label="Provider",
-                value=os.getenv("DEFAULT_LLM", "openai"),
+                value=defaults.default_llm,
                 interactive=True,
             )
-            default_provider = os.getenv("DEFAULT_LLM", "openai")
-            default_models = config.model_names.get(default_provider, [])
             llm_model_name = gr.Dropdown(
                 label="Model",
-                choices=default_models,
-                value=default_models[0] if default_models else "",
+                choices=list(defaults.default_models),
+                value=defaults.default_models[0] if defaults.default_models else "",
                 interactive=True,
                 allow_custom_value=True,
             )
@@ -173,7 +304,7 @@ def create_dashboard_settings(webui_manager: WebuiManager):
 
             with gr.Row():
                 planner_llm_provider = gr.Dropdown(
-                    choices=[provider for provider, model in config.model_names.items()],
+                    choices=_PROVIDER_CHOICES,
                     label="Planner Provider",
                     value=None,
                     interactive=True,
@@ -223,6 +354,28 @@ def create_dashboard_settings(webui_manager: WebuiManager):
                         placeholder="sk-...",
                     )
 
+    return {
+        "llm_provider": llm_provider,
+        "llm_model_name": llm_model_name,
+        "llm_temperature": llm_temperature,
+        "use_vision": use_vision,
+        "llm_base_url": llm_base_url,
+        "llm_api_key": llm_api_key,
+        "ollama_num_ctx": ollama_num_ctx,
+        "use_planner": use_planner,
+        "planner_group": planner_group,
+        "planner_llm_provider": planner_llm_provider,
+        "planner_llm_model_name": planner_llm_model_name,
+        "planner_llm_temperature": planner_llm_temperature,
+        "planner_use_vision": planner_use_vision,
+        "planner_ollama_num_ctx": planner_ollama_num_ctx,
+        "planner_llm_base_url": planner_llm_base_url,
+        "planner_llm_api_key": planner_llm_api_key,
+    }
+
+
+def _build_browser_section(defaults: _Defaults) -> dict[str, Any]:
+    """Build the browser accordion, including advanced browser settings."""
     # 🌐 Browser Configuration
     with gr.Accordion("🌐 Browser Configuration", open=False):
         gr.Markdown("**Browser behavior and connection settings**")
@@ -230,7 +383,7 @@ def create_dashboard_settings(webui_manager: WebuiManager):
         # Custom Browser
         use_own_browser = gr.Checkbox(
             label="Use Own Browser",
-            value=bool(strtobool(os.getenv("USE_OWN_BROWSER", "false"))),
+            value=defaults.use_own_browser,
             info="Connect to your Chrome instance",
             interactive=True,
         )
@@ -258,7 +411,7 @@ def create_dashboard_settings(webui_manager: WebuiManager):
             )
             keep_browser_open = gr.Checkbox(
                 label="Keep Open",
-                value=bool(strtobool(os.getenv("KEEP_BROWSER_OPEN", "true"))),
+                value=defaults.keep_browser_open,
                 info="Persist between tasks",
                 interactive=True,
             )
@@ -288,7 +441,7 @@ def create_dashboard_settings(webui_manager: WebuiManager):
             with gr.Row():
                 cdp_url = gr.Textbox(
                     label="CDP URL",
-                    value=os.getenv("BROWSER_CDP", None),
+                    value=defaults.browser_cdp,
                     placeholder="http://localhost:9222",
                 )
                 wss_url = gr.Textbox(
@@ -317,33 +470,34 @@ def create_dashboard_settings(webui_manager: WebuiManager):
                     value="./tmp/downloads",
                 )
 
+    return {
+        "use_own_browser": use_own_browser,
+        "custom_browser_group": custom_browser_group,
+        "browser_binary_path": browser_binary_path,
+        "browser_user_data_dir": browser_user_data_dir,
+        "headless": headless,
+        "keep_browser_open": keep_browser_open,
+        "disable_security": disable_security,
+        "window_w": window_w,
+        "window_h": window_h,
+        "cdp_url": cdp_url,
+        "wss_url": wss_url,
+        "save_recording_path": save_recording_path,
+        "save_trace_path": save_trace_path,
+        "save_agent_history_path": save_agent_history_path,
+        "save_download_path": save_download_path,
+    }
+
+
+def _build_mcp_section() -> dict[str, Any]:
+    """Build the MCP servers accordion."""
     # 🔌 MCP Servers
     with gr.Accordion("🔌 MCP Servers", open=False):
         gr.Markdown("**Model Context Protocol server configuration**")
 
-        # MCP Status Display
-        mcp_config_path = get_mcp_config_path()
-        mcp_config = load_mcp_config()
-
-        if mcp_config and "mcpServers" in mcp_config:
-            summary = get_mcp_config_summary(mcp_config)
-            mcp_status_md = f"""
-✅ **MCP Configuration Active**
-
-{summary}
-
-Configuration file: `{mcp_config_path}`
-"""
-        else:
-            mcp_status_md = f"""
-ℹ️ **No MCP Configuration**
-
-No MCP servers configured. You can add servers via the MCP Settings editor.
-
-Expected file: `{mcp_config_path}`
-"""
-
-        mcp_status_display = gr.Markdown(mcp_status_md)
+        # MCP Status Display (filled by a demo.load event wired in interface.py,
+        # so reading the config stays off the UI build path)
+        mcp_status_display = gr.Markdown("⏳ Loading MCP status…")
 
         # Button to open MCP settings (will be handled in interface.py)
         edit_mcp_button = gr.Button(
@@ -366,6 +520,16 @@ Expected file: `{mcp_config_path}`
             visible=False,
         )
 
+    return {
+        "mcp_status_display": mcp_status_display,
+        "edit_mcp_button": edit_mcp_button,
+        "mcp_json_file": mcp_json_file,
+        "mcp_server_config": mcp_server_config,
+    }
+
+
+def _build_advanced_section() -> dict[str, Any]:
+    """Build the advanced accordion with system prompts and agent limits."""
     # ⚡ Advanced Settings
     with gr.Accordion("⚡ Advanced Settings", open=False):
         gr.Markdown("**System prompts and agent parameters**")
@@ -420,120 +584,75 @@ Expected file: `{mcp_config_path}`
                 allow_custom_value=True,
             )
 
-    gr.Markdown("---")
-
-    # Save/Load Config at Bottom (repeated for convenience)
-    with gr.Row():
-        save_config_button_bottom = gr.Button("💾 Save Configuration", variant="primary")
-        load_config_button_bottom = gr.Button("📂 Load Configuration", variant="secondary")
-
-    # NOTE: agent_settings registration removed to avoid duplicate component registrations
-    # All components are now registered under dashboard_settings namespace only
-    # Browser use agent tab will read from dashboard_settings namespace
-
-    # Register agent settings components for backward compatibility ONLY
-    # These are registered under dashboard_settings namespace below
-    agent_settings_components = {
+    return {
         "override_system_prompt": override_system_prompt,
         "extend_system_prompt": extend_system_prompt,
-        "llm_provider": llm_provider,
-        "llm_model_name": llm_model_name,
-        "llm_temperature": llm_temperature,
-        "use_vision": use_vision,
-        "llm_base_url": llm_base_url,
-        "llm_api_key": llm_api_key,
-        "ollama_num_ctx": ollama_num_ctx,
-        "planner_llm_provider": planner_llm_provider,
-        "planner_llm_model_name": planner_llm_model_name,
-        "planner_llm_temperature": planner_llm_temperature,
-        "planner_use_vision": planner_use_vision,
-        "planner_ollama_num_ctx": planner_ollama_num_ctx,
-        "planner_llm_base_url": planner_llm_base_url,
-        "planner_llm_api_key": planner_llm_api_key,
         "max_steps": max_steps,
         "max_actions": max_actions,
         "max_input_tokens": max_input_tokens,
         "tool_calling_method": tool_calling_method,
-        "mcp_json_file": mcp_json_file,
-        "mcp_server_config": mcp_server_config,
     }
-    # Duplicate registration removed - only register under dashboard_settings
-    # webui_manager.add_components("agent_settings", agent_settings_components)
 
-    # Register browser settings components with old-style IDs for compatibility
-    browser_settings_components = {
-        "browser_binary_path": browser_binary_path,
-        "browser_user_data_dir": browser_user_data_dir,
-        "use_own_browser": use_own_browser,
-        "keep_browser_open": keep_browser_open,
-        "headless": headless,
-        "disable_security": disable_security,
-        "window_w": window_w,
-        "window_h": window_h,
-        "cdp_url": cdp_url,
-        "wss_url": wss_url,
-        "save_recording_path": save_recording_path,
-        "save_trace_path": save_trace_path,
-        "save_agent_history_path": save_agent_history_path,
-        "save_download_path": save_download_path,
-    }
-    webui_manager.add_components("browser_settings", browser_settings_components)
-
-    # Register dashboard settings components
-    settings_components.update(
-        {
-            "save_config_button": save_config_button,
-            "save_default_button": save_default_button,
-            "load_config_button": load_config_button,
-            "config_file": config_file,
-            "config_status": config_status,
-            "llm_provider": llm_provider,
-            "llm_model_name": llm_model_name,
-            "llm_temperature": llm_temperature,
-            "use_vision": use_vision,
-            "llm_base_url": llm_base_url,
-            "llm_api_key": llm_api_key,
-            "ollama_num_ctx": ollama_num_ctx,
-            "use_planner": use_planner,
-            "planner_group": planner_group,
-            "planner_llm_provider": planner_llm_provider,
-            "planner_llm_model_name": planner_llm_model_name,
-            "planner_llm_temperature": planner_llm_temperature,
-            "planner_use_vision": planner_use_vision,
-            "planner_ollama_num_ctx": planner_ollama_num_ctx,
-            "planner_llm_base_url": planner_llm_base_url,
-            "planner_llm_api_key": planner_llm_api_key,
-            "use_own_browser": use_own_browser,
-            "custom_browser_group": custom_browser_group,
-            "browser_binary_path": browser_binary_path,
-            "browser_user_data_dir": browser_user_data_dir,
-            "headless": headless,
-            "keep_browser_open": keep_browser_open,
-            "disable_security": disable_security,
-            "window_w": window_w,
-            "window_h": window_h,
-            "cdp_url": cdp_url,
-            "wss_url": wss_url,
-            "save_recording_path": save_recording_path,
-            "save_trace_path": save_trace_path,
-            "save_agent_history_path": save_agent_history_path,
-            "save_download_path": save_download_path,
-            "mcp_status_display": mcp_status_display,
-            "edit_mcp_button": edit_mcp_button,
-            "mcp_json_file": mcp_json_file,
-            "mcp_server_config": mcp_server_config,
-            "override_system_prompt": override_system_prompt,
-            "extend_system_prompt": extend_system_prompt,
-            "max_steps": max_steps,
-            "max_actions": max_actions,
-            "max_input_tokens": max_input_tokens,
-            "tool_calling_method": tool_calling_method,
-            "save_config_button_bottom": save_config_button_bottom,
-            "load_config_button_bottom": load_config_button_bottom,
-        }
+
+def create_dashboard_settings(webui_manager: WebuiManager) -> dict[str, Any]:
+    """
+    Create the collapsible settings panel with consolidated configuration.
+
+    Args:
+        webui_manager: WebUI manager instance
+    """
+    defaults = _get_defaults()
+
+    gr.Markdown("## ⚙️ Settings")
+
+    # Save/Load Config at Top
+    with gr.Row():
+        save_config_button = gr.Button("💾 Save", variant="primary", scale=1, size="sm")
+        save_default_button = gr.Button("⭐ Save as Default", variant="primary", scale=1, size="sm")
+        load_config_button = gr.Button("📂 Load", variant="secondary", scale=1, size="sm")
+
+    config_file = gr.File(
+        label="Configuration File",
+        file_types=[".json"],
+        interactive=True,
+        visible=False,
     )
+    config_status = gr.Textbox(label="Status", lines=1, interactive=False, visible=False)
+
+    gr.Markdown("---")
+
+    # Each section returns the components it registers, keyed by component name
+    section_components = {
+        **_build_llm_section(defaults),
+        **_build_browser_section(defaults),
+        **_build_mcp_section(),
+        **_build_advanced_section(),
+    }
+
+    gr.Markdown("---")
+
+    # Save/Load Config at Bottom (repeated for convenience)
+    with gr.Row():
+        save_config_button_bottom = gr.Button("💾 Save Configuration", variant="primary")
+        load_config_button_bottom = gr.Button("📂 Load Configuration", variant="secondary")
+
+    # All components are registered once under the dashboard_settings namespace;
+    # the old agent_settings/browser_settings IDs resolve to them via aliases.
+    # Order defines the order of values passed to save/run handlers.
+    settings_components = {
+        "save_config_button": save_config_button,
+        "save_default_button": save_default_button,
+        "load_config_button": load_config_button,
+        "config_file": config_file,
+        "config_status": config_status,
+        **section_components,
+        "save_config_button_bottom": save_config_button_bottom,
+        "load_config_button_bottom": load_config_button_bottom,
+    }
 
     webui_manager.add_components("dashboard_settings", settings_components)
+    webui_manager.add_aliases("dashboard_settings", "agent_settings", _AGENT_SETTINGS_KEYS)
+    webui_manager.add_aliases("dashboard_settings", "browser_settings", _BROWSER_SETTINGS_KEYS)
 
     # NOTE: Event handlers are now wired up in interface.py AFTER all components are registered
     # This prevents race conditions and ensures Gradio's event system initializes properly
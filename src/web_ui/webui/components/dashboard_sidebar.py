@@ -4,12 +4,16 @@ Dashboard Sidebar Component
 Provides status display, quick presets, task history, browser status, and token usage.
 """
 
+import html
 import logging
 import os
+import time
+from itertools import islice
+from typing import Any
 
 import gradio as gr
 
-from src.web_ui.utils.mcp_config import get_mcp_config_path, load_mcp_config
+from src.web_ui.utils.mcp_config import load_mcp_config_cached
 from src.web_ui.webui.webui_manager import WebuiManager
 
 logger = logging.getLogger(__name__)
@@ -59,6 +63,116 @@ PRESETS = {
 }
 
 
+# (checked_at, default_llm, api_key_set); env vars don't change between refreshes
+_ENV_TTL_SECONDS = 5.0
+_llm_env_cache: tuple[float, str, bool] | None = None
+
+# Minimum interval between recomputed sidebar refreshes
+_REFRESH_THROTTLE_SECONDS = 0.25
+
+
+def _get_llm_env() -> tuple[str, bool]:
+    """Return the default LLM provider and whether its API key is set."""
+    global _llm_env_cache
+    now = time.monotonic()
+    if _llm_env_cache is None or now - _llm_env_cache[0] > _ENV_TTL_SECONDS:
+        default_llm = os.getenv("DEFAULT_LLM", "openai")
+        api_key_set = bool(os.getenv(f"{default_llm.upper()}_API_KEY"))
+        _llm_env_cache = (now, default_llm, api_key_set)
+    return _llm_env_cache[1], _llm_env_cache[2]
+
+
+# Static HTML fragments for the sidebar cards; only the variable spans are
+# spliced in per refresh
+_STATUS_TPL = (
+    """
+    <div class="status-card">
+        <h3 style="margin-top: 0; font-size: 1.1em; margin-bottom: 12px;">📊 Status</h3>
+        <div style="display: flex; flex-direction: column; gap: 8px;">
+            <div style="display: flex; align-items: center;">
+                <strong style="width: 80px;">LLM:</strong>
+                <span>""",
+    """</span>
+            </div>
+            <div style="display: flex; align-items: center;">
+                <strong style="width: 80px;">Browser:</strong>
+                <span>""",
+    """</span>
+            </div>
+            <div style="display: flex; align-items: center;">
+                <strong style="width: 80px;">MCP:</strong>
+                <span>""",
+    """</span>
+            </div>
+        </div>
+    </div>
+    """,
+)
+
+_HISTORY_EMPTY_HTML = """
+        <div class="status-card">
+            <h3 style="margin-top: 0; font-size: 1.1em; margin-bottom: 12px;">📜 Recent Tasks</h3>
+            <p style="color: rgba(128, 128, 128, 0.7); font-size: 0.9em;">No recent tasks</p>
+        </div>
+        """
+
+_HISTORY_TPL = (
+    """
+    <div class="status-card">
+        <h3 style="margin-top: 0; font-size: 1.1em; margin-bottom: 12px;">📜 Recent Tasks</h3>
+        <div class="history-list">
+            """,
+    """
+        </div>
+    </div>
+    """,
+)
+
+_HISTORY_ITEM_TPL = (
+    """
+            <div class="history-item" title=\"""",
+    """\">
+                """,
+    """ <span style="font-size: 0.85em; opacity: 0.7;">""",
+    """</span><br/>
+                <span style="font-size: 0.9em;">""",
+    """</span>
+            </div>
+        """,
+)
+
+_TOKEN_USAGE_TPL = (
+    """
+    <div class="status-card">
+        <h3 style="margin-top: 0; font-size: 1.1em; margin-bottom: 12px;">💰 Usage</h3>
+        <div style="display: flex; flex-direction: column; gap: 6px;">
+            <div>
+                <strong>Tokens:</strong> """,
+    """
+            </div>
+            <div>
+                <strong>Est. Cost:</strong> $""",
+    """
+            </div>
+        </div>
+    </div>
+    """,
+)
+
+# Settings components targeted by presets, keyed by preset config key
+_PRESET_COMPONENT_IDS = {
+    "llm_provider": "dashboard_settings.llm_provider",
+    "llm_model_name": "dashboard_settings.llm_model_name",
+    "llm_temperature": "dashboard_settings.llm_temperature",
+    "use_vision": "dashboard_settings.use_vision",
+    "max_steps": "dashboard_settings.max_steps",
+    "max_actions": "dashboard_settings.max_actions",
+    "headless": "dashboard_settings.headless",
+    "keep_browser_open": "dashboard_settings.keep_browser_open",
+    "use_own_browser": "dashboard_settings.use_own_browser",
+}
+
+
 def get_status_summary(webui_manager: WebuiManager) -> dict:
     """
     Get current status of LLM, Browser, and MCP configuration.
@@ -75,9 +189,7 @@ def get_status_summary(webui_manager: WebuiManager) -> dict:
 
     # Check LLM configuration
     try:
-        default_llm = os.getenv("DEFAULT_LLM", "openai")
-        api_key_var = f"{default_llm.upper()}_API_KEY"
-        api_key_set = bool(os.getenv(api_key_var))
+        default_llm, api_key_set = _get_llm_env()
 
         if api_key_set:
             status["llm"]["configured"] = True
@@ -100,8 +212,7 @@ def get_status_summary(webui_manager: WebuiManager) -> dict:
 
     # Check MCP configuration
     try:
-        get_mcp_config_path()  # Check if config exists
-        mcp_config = load_mcp_config()
+        mcp_config = load_mcp_config_cached()
         if mcp_config and "mcpServers" in mcp_config:
             mcp_count = len(mcp_config["mcpServers"])
             status["mcp"]["configured"] = True
@@ -112,9 +223,8 @@ def get_status_summary(webui_manager: WebuiManager) -> dict:
     except Exception as e:
         logger.error(f"Error checking MCP status: {e}")
 
-    # Get token usage if available
-    if hasattr(webui_manager, "token_usage") and webui_manager.token_usage:
-        status["tokens"] = webui_manager.token_usage
+    # Token usage counters
+    status["tokens"] = {"used": webui_manager.token_used, "cost": webui_manager.token_cost}
 
     return status
 
@@ -123,98 +233,77 @@ def format_status_card(webui_manager: WebuiManager) -> str:
     """Format status information as HTML card."""
     status = get_status_summary(webui_manager)
 
-    html = """
-    <div class="status-card">
-        <h3 style="margin-top: 0; font-size: 1.1em; margin-bottom: 12px;">📊 Status</h3>
-        <div style="display: flex; flex-direction: column; gap: 8px;">
-            <div style="display: flex; align-items: center;">
-                <strong style="width: 80px;">LLM:</strong>
-                <span>{llm_status}</span>
-            </div>
-            <div style="display: flex; align-items: center;">
-                <strong style="width: 80px;">Browser:</strong>
-                <span>{browser_status}</span>
-            </div>
-            <div style="display: flex; align-items: center;">
-                <strong style="width: 80px;">MCP:</strong>
-                <span>{mcp_status}</span>
-            </div>
-        </div>
-    </div>
-    """.format(
-        llm_status=status["llm"]["status_text"],
-        browser_status=status["browser"]["status_text"],
-        mcp_status=status["mcp"]["status_text"],
+    return "".join(
+        (
+            _STATUS_TPL[0],
+            status["llm"]["status_text"],
+            _STATUS_TPL[1],
+            status["browser"]["status_text"],
+            _STATUS_TPL[2],
+            status["mcp"]["status_text"],
+            _STATUS_TPL[3],
+        )
     )
 
-    return html
-
 
 def format_history_list(webui_manager: WebuiManager) -> str:
     """Format recent task history as HTML."""
     if not hasattr(webui_manager, "recent_tasks") or not webui_manager.recent_tasks:
-        return """
-        <div class="status-card">
-            <h3 style="margin-top: 0; font-size: 1.1em; margin-bottom: 12px;">📜 Recent Tasks</h3>
-            <p style="color: rgba(128, 128, 128, 0.7); font-size: 0.9em;">No recent tasks</p>
-        </div>
-        """
+        return _HISTORY_EMPTY_HTML
 
+    escape = html.escape
     items = []
-    for task in webui_manager.recent_tasks[-5:]:  # Last 5 tasks
+    for task in islice(reversed(webui_manager.recent_tasks), 5):  # Last 5 tasks, newest first
         task_text = task.get("task", "Unknown task")
-        timestamp = task.get("timestamp", "")
-        status_icon = "✅" if task.get("success", False) else "❌"
 
-        # Truncate long task descriptions
+        # Truncate long task descriptions before escaping
         if len(task_text) > 50:
             task_text = task_text[:47] + "..."
 
         items.append(
-            f"""
-            <div class="history-item" title="{task.get("task", "")}">
-                {status_icon} <span style="font-size: 0.85em; opacity: 0.7;">{timestamp}</span><br/>
-                <span style="font-size: 0.9em;">{task_text}</span>
-            </div>
-        """
+            "".join(
+                (
+                    _HISTORY_ITEM_TPL[0],
+                    escape(task.get("task", "")),
+                    _HISTORY_ITEM_TPL[1],
+                    "✅" if task.get("success", False) else "❌",
+                    _HISTORY_ITEM_TPL[2],
+                    escape(str(task.get("timestamp", ""))),
+                    _HISTORY_ITEM_TPL[3],
+                    escape(task_text),
+                    _HISTORY_ITEM_TPL[4],
+                )
+            )
         )
 
-    html = f"""
-    <div class="status-card">
-        <h3 style="margin-top: 0; font-size: 1.1em; margin-bottom: 12px;">📜 Recent Tasks</h3>
-        <div class="history-list">
-            {"".join(reversed(items))}
-        </div>
-    </div>
-    """
-
-    return html
+    return "".join((_HISTORY_TPL[0], "".join(items), _HISTORY_TPL[1]))
 
 
 def format_token_usage(webui_manager: WebuiManager) -> str:
     """Format token usage information as HTML."""
-    if not hasattr(webui_manager, "token_usage") or not webui_manager.token_usage:
-        return ""
+    used = webui_manager.token_used
+    cost = webui_manager.token_cost
+
+    return "".join(
+        (
+            _TOKEN_USAGE_TPL[0],
+            f"{used:,}",
+            _TOKEN_USAGE_TPL[1],
+            f"{cost:.4f}",
+            _TOKEN_USAGE_TPL[2],
+        )
+    )
 
-    tokens = webui_manager.token_usage
-    used = tokens.get("used", 0)
-    cost = tokens.get("cost", 0.0)
 
-    html = f"""
-    <div class="status-card">
-        <h3 style="margin-top: 0; font-size: 1.1em; margin-bottom: 12px;">💰 Usage</h3>
-        <div style="display: flex; flex-direction: column; gap: 6px;">
-            <div>
-                <strong>Tokens:</strong> {used:,}
-            </div>
-            <div>
-                <strong>Est. Cost:</strong> ${cost:.4f}
-            </div>
-        </div>
-    </div>
-    """
-
-    return html
+def format_sidebar_status(webui_manager: WebuiManager) -> str:
+    """Format the status, history and token usage cards as one HTML block."""
+    return "".join(
+        (
+            format_status_card(webui_manager),
+            format_history_list(webui_manager),
+            format_token_usage(webui_manager),
+        )
+    )
 
 
 def load_preset_config(preset_name: str, webui_manager: WebuiManager):
@@ -232,35 +321,18 @@ def load_preset_config(preset_name: str, webui_manager: WebuiManager):
         logger.warning(f"Unknown preset: {preset_name}")
         return []
 
-    preset = PRESETS[preset_name]
-    preset_config = preset["config"]
+    preset_config = PRESETS[preset_name]["config"]
 
-    # Map preset values to component IDs and create updates
+    # Map preset values to components
     updates = []
-
-    # Get all components that need updating
-    component_mapping = {
-        "llm_provider": "dashboard_settings.llm_provider",
-        "llm_model_name": "dashboard_settings.llm_model_name",
-        "llm_temperature": "dashboard_settings.llm_temperature",
-        "use_vision": "dashboard_settings.use_vision",
-        "max_steps": "dashboard_settings.max_steps",
-        "max_actions": "dashboard_settings.max_actions",
-        "headless": "dashboard_settings.headless",
-        "keep_browser_open": "dashboard_settings.keep_browser_open",
-        "use_own_browser": "dashboard_settings.use_own_browser",
-    }
-
-    for config_key, component_id in component_mapping.items():
-        if config_key in preset_config:
-            try:
-                component = webui_manager.get_component_by_id(component_id)
-                if isinstance(preset_config, dict):
-                    updates.append((component, preset_config[config_key]))
-            except KeyError:
-                logger.debug(f"Component not found: {component_id}")
-                continue
-
+    for config_key, component_id in _PRESET_COMPONENT_IDS.items():
+        if config_key not in preset_config:
+            continue
+        component = webui_manager.find_component_by_id(component_id)
+        if component is None:
+            logger.debug(f"Component not found: {component_id}")
+            continue
+        updates.append((component, preset_config[config_key]))
     return updates
 
 
@@ -274,9 +346,10 @@ def create_dashboard_sidebar(webui_manager: WebuiManager):
     sidebar_components = {}
 
     with gr.Column(elem_classes=["dashboard-sidebar"]):
-        # Status Card
+        # Status, Task History and Token Usage cards in one component so a
+        # refresh is a single update
         status_display = gr.HTML(
-            value=format_status_card(webui_manager),
+            value=format_sidebar_status(webui_manager),
             elem_classes=["status-display"],
         )
 
@@ -310,19 +383,6 @@ def create_dashboard_sidebar(webui_manager: WebuiManager):
                 elem_classes=["preset-button"],
             )
 
-        # Task History
-        history_display = gr.HTML(
-            value=format_history_list(webui_manager),
-            elem_classes=["history-display"],
-        )
-
-        # Token Usage (optional, only shown if data available)
-        token_display = gr.HTML(
-            value=format_token_usage(webui_manager),
-            visible=bool(hasattr(webui_manager, "token_usage") and webui_manager.token_usage),
-            elem_classes=["token-display"],
-        )
-
     # Register components
     sidebar_components.update(
         {
@@ -331,26 +391,28 @@ def create_dashboard_sidebar(webui_manager: WebuiManager):
             "research_btn": research_btn,
             "automation_btn": automation_btn,
             "custom_browser_btn": custom_browser_btn,
-            "history_display": history_display,
-            "token_display": token_display,
         }
     )
 
     webui_manager.add_components("dashboard_sidebar", sidebar_components)
 
-    # Wire up refresh button
+    # Wire up refresh button; clicks within the throttle window reuse the last HTML
+    last_refresh: dict[str, Any] = {"t": 0.0, "html": None}
+
     def refresh_status():
         """Refresh all status displays."""
-        return [
-            gr.update(value=format_status_card(webui_manager)),
-            gr.update(value=format_history_list(webui_manager)),
-            gr.update(value=format_token_usage(webui_manager)),
-        ]
+        now = time.monotonic()
+        if last_refresh["html"] is None or now - last_refresh["t"] >= _REFRESH_THROTTLE_SECONDS:
+            last_refresh["html"] = format_sidebar_status(webui_manager)
+            last_refresh["t"] = now
+
+        # Fresh update dict each time; Gradio consumes it during postprocessing
+        return gr.update(value=last_refresh["html"])
 
     refresh_status_btn.click(
         fn=refresh_status,
         inputs=[],
-        outputs=[status_display, history_display, token_display],
+        outputs=[status_display],
     )
 
     # Note: Preset button handlers will be wired up after dashboard_settings is created
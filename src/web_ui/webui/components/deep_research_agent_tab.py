@@ -136,7 +136,7 @@ async def run_deep_research(
         # --- 3. Get LLM and Browser Config from other tabs ---
         # Access settings values via components dict, getting IDs from webui_manager
         def get_setting(tab: str, key: str, default: Any = None):
-            comp = webui_manager.id_to_component.get(f"{tab}.{key}")
+            comp = webui_manager.find_component_by_id(f"{tab}.{key}")
             return components.get(comp, default) if comp else default
 
         # LLM Config (from agent_settings tab)
@@ -184,7 +184,7 @@ async def run_deep_research(
             save_dir=base_save_dir,
             max_parallel_browsers=max_parallel_agents,
         )
-        agent_task = asyncio.create_task(agent_run_coro)
+        agent_task = webui_manager.start_agent_task(agent_run_coro)
         webui_manager.dr_current_task = agent_task
 
         # Wait briefly for the agent to start and potentially create the task ID/folder
@@ -29,24 +29,21 @@ def create_load_save_config_tab(webui_manager: WebuiManager):
 
     webui_manager.add_components("load_save_config", tab_components)
 
+    # Snapshot the registry once; save and load are wired against the same order
+    all_components = webui_manager.get_components()
+
     def save_config_wrapper(*args):
         """Wrapper for save_config that accepts individual component values."""
-        # Convert individual component values to a components dict
-        components_dict = {}
-        all_components = webui_manager.get_components()
-        for i, comp in enumerate(all_components):
-            if i < len(args):
-                components_dict[comp] = args[i]
-        return webui_manager.save_config(components_dict)
+        return webui_manager.save_config(*args)
 
     save_config_button.click(
         fn=save_config_wrapper,
-        inputs=list(webui_manager.get_components()),
+        inputs=all_components,
         outputs=[config_status],
     )
 
     load_config_button.click(
         fn=webui_manager.load_config,
         inputs=[config_file],
-        outputs=webui_manager.get_components(),
+        outputs=all_components,
     )
@@ -4,11 +4,15 @@ MCP Settings Tab Component
 Provides UI for editing MCP (Model Context Protocol) server configuration.
 """
 
-import json
+import asyncio
 import logging
+from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
 
 import gradio as gr
+import orjson
+from gradio.components import Component
 
 from src.web_ui.utils.mcp_config import (
     get_default_mcp_config,
@@ -16,14 +20,43 @@ from src.web_ui.utils.mcp_config import (
     get_mcp_config_summary,
     load_mcp_config,
     save_mcp_config,
-    validate_mcp_config,
+    validate_mcp_config_with_summary,
 )
 from src.web_ui.webui.webui_manager import WebuiManager
 
 logger = logging.getLogger(__name__)
 
 
-def load_mcp_config_ui(custom_path: str | None = None):
+def _dumps(config: dict) -> str:
+    """Pretty-print a configuration as 2-space indented JSON text."""
+    return orjson.dumps(config, option=orjson.OPT_INDENT_2).decode()
+
+
+# Tab components filled by load_mcp_config_ui, in the order of its tuple result
+_LOAD_OUTPUT_KEYS = ("mcp_config_editor", "status_message", "validation_message", "server_summary")
+
+
+async def load_mcp_config_ui(
+    custom_path: str | None = None, components: Mapping[str, Component] | None = None
+):
+    """
+    Load MCP configuration for UI display without blocking the event loop.
+
+    Args:
+        custom_path: Optional custom path to load from
+        components: Tab components; when given, the result is keyed by component
+
+    Returns:
+        Tuple of (config_json_str, status_message, validation_message, summary),
+        or the same values as a component-keyed dict when components is given
+    """
+    result = await asyncio.to_thread(_load_mcp_config_display, custom_path)
+    if components is None:
+        return result
+    return {components[key]: value for key, value in zip(_LOAD_OUTPUT_KEYS, result, strict=True)}
+
+
+def _load_mcp_config_display(custom_path: str | None = None):
     """
     Load MCP configuration for UI display.
 
@@ -55,7 +88,7 @@ def load_mcp_config_ui(custom_path: str | None = None):
             validation = "✅ Valid configuration"
 
         # Convert to pretty JSON string
-        config_json = json.dumps(config, indent=2, ensure_ascii=False)
+        config_json = _dumps(config)
 
         return (
             config_json,
@@ -68,14 +101,14 @@ def load_mcp_config_ui(custom_path: str | None = None):
         logger.error(f"Error loading MCP configuration: {e}", exc_info=True)
         default_config = get_default_mcp_config()
         return (
-            json.dumps(default_config, indent=2),
+            _dumps(default_config),
             f"❌ Error loading configuration: {e}",
             "⚠️ Using default configuration",
             "",
         )
 
 
-def save_mcp_config_ui(config_text: str, custom_path: str | None = None):
+async def save_mcp_config_ui(config_text: str, custom_path: str | None = None):
     """
     Save MCP configuration from UI.
 
@@ -89,16 +122,16 @@ def save_mcp_config_ui(config_text: str, custom_path: str | None = None):
     try:
         # Parse JSON
         try:
-            config = json.loads(config_text)
-        except json.JSONDecodeError as e:
+            config = orjson.loads(config_text)
+        except orjson.JSONDecodeError as e:
             return (
                 f"❌ Invalid JSON: {e}",
                 "❌ Cannot save invalid JSON",
                 "",
             )
 
-        # Validate configuration
-        is_valid, error_msg = validate_mcp_config(config)
+        # Validate configuration and build its summary in one pass
+        is_valid, error_msg, summary = validate_mcp_config_with_summary(config)
         if not is_valid:
             return (
                 f"❌ Invalid configuration: {error_msg}",
@@ -113,13 +146,13 @@ def save_mcp_config_ui(config_text: str, custom_path: str | None = None):
             config_path = get_mcp_config_path()
 
         # Save configuration
-        success = save_mcp_config(config, config_path)
+        success = await asyncio.to_thread(save_mcp_config, config, config_path, assume_valid=True)
 
         if success:
             return (
                 f"✅ Configuration saved to {config_path}",
                 "✅ Valid configuration",
-                get_mcp_config_summary(config),
+                summary,
             )
         else:
             return (
@@ -137,7 +170,7 @@ def save_mcp_config_ui(config_text: str, custom_path: str | None = None):
         )
 
 
-def validate_mcp_config_ui(config_text: str):
+async def validate_mcp_config_ui(config_text: str):
     """
     Validate MCP configuration from UI.
 
@@ -150,20 +183,20 @@ def validate_mcp_config_ui(config_text: str):
     try:
         # Parse JSON
         try:
-            config = json.loads(config_text)
-        except json.JSONDecodeError as e:
+            config = orjson.loads(config_text)
+        except orjson.JSONDecodeError as e:
             return (
                 f"❌ Invalid JSON: {e}",
                 "",
             )
 
-        # Validate configuration
-        is_valid, error_msg = validate_mcp_config(config)
+        # Validate configuration and build its summary in one pass
+        is_valid, error_msg, summary = validate_mcp_config_with_summary(config)
 
         if is_valid:
             return (
                 "✅ Valid configuration",
-                get_mcp_config_summary(config),
+                summary,
             )
         else:
             return (
@@ -179,7 +212,7 @@ def validate_mcp_config_ui(config_text: str):
         )
 
 
-def reset_mcp_config_ui():
+async def reset_mcp_config_ui():
     """
     Reset MCP configuration to default.
 
@@ -187,7 +220,7 @@ def reset_mcp_config_ui():
         Tuple of (config_json_str, status_message, validation_message, summary)
     """
     default_config = get_default_mcp_config()
-    config_json = json.dumps(default_config, indent=2, ensure_ascii=False)
+    config_json = _dumps(default_config)
 
     return (
         config_json,
@@ -197,7 +230,14 @@ def reset_mcp_config_ui():
     )
 
 
-def load_example_config_ui():
+def _read_example(example_path: Path) -> bytes | None:
+    """Read the example configuration file, or return None if it is missing."""
+    if not example_path.exists():
+        return None
+    return example_path.read_bytes()
+
+
+async def load_example_config_ui():
     """
     Load example MCP configuration.
 
@@ -207,7 +247,8 @@ def load_example_config_ui():
     try:
         example_path = Path("mcp.example.json")
 
-        if not example_path.exists():
+        data = await asyncio.to_thread(_read_example, example_path)
+        if data is None:
             return (
                 gr.update(),  # Don't change editor content
                 "❌ mcp.example.json not found",
@@ -215,10 +256,8 @@ def load_example_config_ui():
                 "",
             )
 
-        with open(example_path, encoding="utf-8") as f:
-            config = json.load(f)
-
-        config_json = json.dumps(config, indent=2, ensure_ascii=False)
+        config = orjson.loads(data)
+        config_json = _dumps(config)
 
         return (
             config_json,
@@ -241,8 +280,14 @@ def create_mcp_settings_tab(webui_manager: WebuiManager):
     """
     Create the MCP Settings tab for editing MCP server configuration.
 
+    The configuration itself is loaded by the caller when the tab is first shown
+    (see ``load_mcp_config_ui``), so building the tab does no disk I/O.
+
     Args:
         webui_manager: WebUI manager instance
+
+    Returns:
+        dict: Tab components
     """
     tab_components = {}
 
@@ -346,9 +391,13 @@ def create_mcp_settings_tab(webui_manager: WebuiManager):
     )
     webui_manager.add_components("mcp_settings", tab_components)
 
+    # Per-session hashes of the (validation, summary) pair the last Validate sent.
+    # gr.State stays on the server, so the comparison costs no upload
+    last_validation = gr.State(None)
+
     # Connect event handlers
-    load_button.click(
-        fn=load_mcp_config_ui,
+    load_event = load_button.click(
+        fn=partial(load_mcp_config_ui, components=tab_components),
         inputs=[config_path_input],
         outputs=[
             mcp_config_editor,
@@ -358,7 +407,7 @@ def create_mcp_settings_tab(webui_manager: WebuiManager):
         ],
     )
 
-    save_button.click(
+    save_event = save_button.click(
         fn=save_mcp_config_ui,
         inputs=[mcp_config_editor, config_path_input],
         outputs=[
@@ -368,16 +417,29 @@ def create_mcp_settings_tab(webui_manager: WebuiManager):
         ],
     )
 
+    async def validate_if_changed(config_text: str, last_hashes: tuple[int, int] | None):
+        """Validate, returning no-op updates for outputs that already show the result."""
+        validation, summary = await validate_mcp_config_ui(config_text)
+        hashes = (hash(validation), hash(summary))
+        if last_hashes is None:
+            return validation, summary, hashes
+        return (
+            gr.update() if hashes[0] == last_hashes[0] else validation,
+            gr.update() if hashes[1] == last_hashes[1] else summary,
+            hashes,
+        )
+
     validate_button.click(
-        fn=validate_mcp_config_ui,
-        inputs=[mcp_config_editor],
+        fn=validate_if_changed,
+        inputs=[mcp_config_editor, last_validation],
         outputs=[
             validation_message,
             server_summary,
+            last_validation,
         ],
     )
 
-    reset_button.click(
+    reset_event = reset_button.click(
         fn=reset_mcp_config_ui,
         inputs=[],
         outputs=[
@@ -388,7 +450,7 @@ def create_mcp_settings_tab(webui_manager: WebuiManager):
         ],
     )
 
-    example_button.click(
+    example_event = example_button.click(
         fn=load_example_config_ui,
         inputs=[],
         outputs=[
@@ -399,9 +461,8 @@ def create_mcp_settings_tab(webui_manager: WebuiManager):
         ],
     )
 
-    # Load configuration on tab creation
-    initial_config_json, initial_status, initial_validation, initial_summary = load_mcp_config_ui()
-    mcp_config_editor.value = initial_config_json
-    status_message.value = initial_status
-    validation_message.value = initial_validation
-    server_summary.value = initial_summary
+    # These handlers rewrite both validation outputs, so the next Validate must resend them
+    for event in (load_event, save_event, reset_event, example_event):
+        event.then(fn=lambda: None, outputs=last_validation)
+
+    return tab_components
@@ -4,12 +4,16 @@ Quick Start Tab Component
 Provides a landing page with preset configurations, status display, and quick actions.
 """
 
+import asyncio
 import logging
 import os
+import time
+from typing import Any
 
 import gradio as gr
+from gradio.components import Component
 
-from src.web_ui.utils.mcp_config import get_mcp_config_path, load_mcp_config
+from src.web_ui.utils.mcp_config import load_mcp_config_cached
 from src.web_ui.webui.webui_manager import WebuiManager
 
 logger = logging.getLogger(__name__)
@@ -62,6 +66,75 @@ PRESETS = {
 }
 
 
+# Status messages shown after a preset is applied
+_RESEARCH_STATUS_MD = """
+✅ **Research Mode Loaded!**
+
+Settings applied:
+- LLM: Claude 3.5 Sonnet
+- Temperature: 0.7 (creative)
+- Vision: Enabled
+- Max Steps: 150
+
+Go to the **Settings** tab to review or adjust these settings.
+"""
+
+_AUTOMATION_STATUS_MD = """
+✅ **Automation Mode Loaded!**
+
+Settings applied:
+- LLM: GPT-4o
+- Temperature: 0.6 (balanced)
+- Vision: Enabled
+- Max Steps: 100
+
+Go to the **Settings** tab to review or adjust these settings.
+"""
+
+_CUSTOM_BROWSER_STATUS_MD = """
+✅ **Custom Browser Mode Loaded!**
+
+Settings applied:
+- LLM: GPT-4o Mini (cost-effective)
+- Use Own Browser: Enabled
+- Vision: Enabled
+
+⚠️ **Important:** Close all Chrome windows before running the agent!
+
+Configure your Chrome path in the **Settings > Browser Settings** tab.
+"""
+
+# Preset config keys mapped to the settings components they populate
+_PRESET_COMPONENT_IDS = {
+    "llm_provider": "agent_settings.llm_provider",
+    "llm_model_name": "agent_settings.llm_model_name",
+    "llm_temperature": "agent_settings.llm_temperature",
+    "use_vision": "agent_settings.use_vision",
+    "max_steps": "agent_settings.max_steps",
+    "max_actions": "agent_settings.max_actions",
+    "headless": "browser_settings.headless",
+    "keep_browser_open": "browser_settings.keep_browser_open",
+    "use_own_browser": "browser_settings.use_own_browser",
+}
+
+# Components every preset updates, in the order the preset values are emitted
+_PRESET_COMMON_IDS = (
+    "agent_settings.llm_provider",
+    "agent_settings.llm_model_name",
+    "agent_settings.llm_temperature",
+    "agent_settings.use_vision",
+    "agent_settings.max_steps",
+    "agent_settings.max_actions",
+    "browser_settings.headless",
+    "browser_settings.keep_browser_open",
+)
+
+# Env vars rarely change, so back-to-back refreshes reuse the last status for a
+# few seconds as long as the MCP config it was built from is still current
+_STATUS_TTL_SECONDS = 5.0
+_status_cache: tuple[float, dict | None, str] | None = None
+
+
 def get_current_config_status() -> str:
     """
     Get current configuration status from environment.
@@ -69,7 +142,18 @@ def get_current_config_status() -> str:
     Returns:
         Markdown string with configuration status
     """
+    global _status_cache
+    now = time.monotonic()
     try:
+        # Cheap while the file is unchanged; a save yields a new config object
+        mcp_config = load_mcp_config_cached()
+        if (
+            _status_cache is not None
+            and now - _status_cache[0] < _STATUS_TTL_SECONDS
+            and _status_cache[1] is mcp_config
+        ):
+            return _status_cache[2]
+
         # Check LLM configuration
         default_llm = os.getenv("DEFAULT_LLM", "openai")
         api_key_var = f"{default_llm.upper()}_API_KEY"
@@ -79,8 +163,6 @@ def get_current_config_status() -> str:
         llm_display = default_llm.title()
 
         # Check MCP configuration
-        get_mcp_config_path()  # Check if config exists
-        mcp_config = load_mcp_config()
         if mcp_config and "mcpServers" in mcp_config:
             mcp_count = len(mcp_config["mcpServers"])
             mcp_status = f"✅ {mcp_count} server(s) configured"
@@ -100,6 +182,7 @@ def get_current_config_status() -> str:
 
 💡 **Tip:** Use preset configurations below to quickly set up common scenarios, or configure settings manually in the Settings tab.
 """
+        _status_cache = (now, mcp_config, status_md)
         return status_md
 
     except Exception as e:
@@ -126,36 +209,32 @@ def load_preset_config(preset_name: str, webui_manager: WebuiManager):
         logger.warning(f"Unknown preset: {preset_name}")
         return []
 
-    preset = PRESETS[preset_name]
-    preset_config = preset["config"]
-
-    # Map preset values to component IDs and create updates
-    updates = []
-
-    # Get all components that need updating
-    component_mapping = {
-        "llm_provider": "agent_settings.llm_provider",
-        "llm_model_name": "agent_settings.llm_model_name",
-        "llm_temperature": "agent_settings.llm_temperature",
-        "use_vision": "agent_settings.use_vision",
-        "max_steps": "agent_settings.max_steps",
-        "max_actions": "agent_settings.max_actions",
-        "headless": "browser_settings.headless",
-        "keep_browser_open": "browser_settings.keep_browser_open",
-        "use_own_browser": "browser_settings.use_own_browser",
-    }
-
-    for config_key, component_id in component_mapping.items():
-        if config_key in preset_config:
-            try:
-                component = webui_manager.get_component_by_id(component_id)
-                if isinstance(preset_config, dict):
-                    updates.append((component, preset_config[config_key]))
-            except KeyError:
-                logger.debug(f"Component not found: {component_id}")
-                continue
-
-    return updates
+    return _resolve_preset(preset_name, webui_manager)
+
+
+def _resolve_preset(preset_name: str, webui_manager: WebuiManager) -> list[tuple[Component, Any]]:
+    """
+    Resolve a preset's settings to the components they update.
+
+    Args:
+        preset_name: Name of the preset to resolve
+        webui_manager: WebUI manager instance
+
+    Returns:
+        (component, value) pairs for the preset
+    """
+    preset_config = PRESETS[preset_name]["config"]
+
+    resolved: list[tuple[Component, Any]] = []
+    for config_key, component_id in _PRESET_COMPONENT_IDS.items():
+        if config_key not in preset_config:
+            continue
+        component = webui_manager.find_component_by_id(component_id)
+        if component is None:
+            logger.debug(f"Component not found: {component_id}")
+            continue
+        resolved.append((component, preset_config[config_key]))
+    return resolved
 
 
 def create_quick_start_tab(webui_manager: WebuiManager):
@@ -306,111 +385,56 @@ def create_quick_start_tab(webui_manager: WebuiManager):
 
     webui_manager.add_components("quick_start", tab_components)
 
+    # Presets are static, so resolve each one's components once here
+    resolved_presets = {name: _resolve_preset(name, webui_manager) for name in PRESETS}
+
     # Connect preset buttons
-    def load_research_preset():
+    async def load_research_preset():
         """Load research preset configuration."""
-        updates = load_preset_config("research", webui_manager)
-        status_msg = """
-✅ **Research Mode Loaded!**
-
-Settings applied:
-- LLM: Claude 3.5 Sonnet
-- Temperature: 0.7 (creative)
-- Vision: Enabled
-- Max Steps: 150
-
-Go to the **Settings** tab to review or adjust these settings.
-"""
+        updates = resolved_presets["research"]
         return [gr.update(value=val) for _, val in updates] + [
-            gr.update(value=status_msg, visible=True)
+            gr.update(value=_RESEARCH_STATUS_MD, visible=True)
         ]
 
-    def load_automation_preset():
+    async def load_automation_preset():
         """Load automation preset configuration."""
-        updates = load_preset_config("automation", webui_manager)
-        status_msg = """
-✅ **Automation Mode Loaded!**
-
-Settings applied:
-- LLM: GPT-4o
-- Temperature: 0.6 (balanced)
-- Vision: Enabled
-- Max Steps: 100
-
-Go to the **Settings** tab to review or adjust these settings.
-"""
+        updates = resolved_presets["automation"]
         return [gr.update(value=val) for _, val in updates] + [
-            gr.update(value=status_msg, visible=True)
+            gr.update(value=_AUTOMATION_STATUS_MD, visible=True)
         ]
 
-    def load_custom_browser_preset():
+    async def load_custom_browser_preset():
         """Load custom browser preset configuration."""
-        updates = load_preset_config("custom_browser", webui_manager)
-        status_msg = """
-✅ **Custom Browser Mode Loaded!**
-
-Settings applied:
-- LLM: GPT-4o Mini (cost-effective)
-- Use Own Browser: Enabled
-- Vision: Enabled
-
-⚠️ **Important:** Close all Chrome windows before running the agent!
-
-Configure your Chrome path in the **Settings > Browser Settings** tab.
-"""
+        updates = resolved_presets["custom_browser"]
         return [gr.update(value=val) for _, val in updates] + [
-            gr.update(value=status_msg, visible=True)
+            gr.update(value=_CUSTOM_BROWSER_STATUS_MD, visible=True)
         ]
 
-    def refresh_status():
+    async def refresh_status():
         """Refresh the status display."""
-        return gr.update(value=get_current_config_status())
+        # The status reads mcp.json, so keep that off the event loop
+        return gr.update(value=await asyncio.to_thread(get_current_config_status))
+
+    # Wire up button clicks; all presets share the same leading outputs
+    common_outputs = [webui_manager.get_component_by_id(cid) for cid in _PRESET_COMMON_IDS]
 
-    # Wire up button clicks
     research_btn.click(
         fn=load_research_preset,
         inputs=[],
-        outputs=[
-            webui_manager.get_component_by_id("agent_settings.llm_provider"),
-            webui_manager.get_component_by_id("agent_settings.llm_model_name"),
-            webui_manager.get_component_by_id("agent_settings.llm_temperature"),
-            webui_manager.get_component_by_id("agent_settings.use_vision"),
-            webui_manager.get_component_by_id("agent_settings.max_steps"),
-            webui_manager.get_component_by_id("agent_settings.max_actions"),
-            webui_manager.get_component_by_id("browser_settings.headless"),
-            webui_manager.get_component_by_id("browser_settings.keep_browser_open"),
-            preset_status,
-        ],
+        outputs=[*common_outputs, preset_status],
     )
 
     automation_btn.click(
         fn=load_automation_preset,
         inputs=[],
-        outputs=[
-            webui_manager.get_component_by_id("agent_settings.llm_provider"),
-            webui_manager.get_component_by_id("agent_settings.llm_model_name"),
-            webui_manager.get_component_by_id("agent_settings.llm_temperature"),
-            webui_manager.get_component_by_id("agent_settings.use_vision"),
-            webui_manager.get_component_by_id("agent_settings.max_steps"),
-            webui_manager.get_component_by_id("agent_settings.max_actions"),
-            webui_manager.get_component_by_id("browser_settings.headless"),
-            webui_manager.get_component_by_id("browser_settings.keep_browser_open"),
-            preset_status,
-        ],
+        outputs=[*common_outputs, preset_status],
     )
 
     custom_browser_btn.click(
         fn=load_custom_browser_preset,
         inputs=[],
         outputs=[
-            webui_manager.get_component_by_id("agent_settings.llm_provider"),
-            webui_manager.get_component_by_id("agent_settings.llm_model_name"),
-            webui_manager.get_component_by_id("agent_settings.llm_temperature"),
-            webui_manager.get_component_by_id("agent_settings.use_vision"),
-            webui_manager.get_component_by_id("agent_settings.max_steps"),
-            webui_manager.get_component_by_id("agent_settings.max_actions"),
-            webui_manager.get_component_by_id("browser_settings.headless"),
-            webui_manager.get_component_by_id("browser_settings.keep_browser_open"),
+            *common_outputs,
             webui_manager.get_component_by_id("browser_settings.use_own_browser"),
             preset_status,
         ],
@@ -2,23 +2,60 @@
 Workflow visualization component for Gradio UI.
 """
 
+import html
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 import gradio as gr
+import orjson
 
+from src.web_ui.utils.utils import minify_css
 
-def create_workflow_visualizer() -> tuple[gr.JSON, gr.Markdown]:
+# Number of most recent steps rendered expanded; older steps start collapsed
+EXPANDED_STEPS = 1
+
+# Values longer than this are cut short in the step details
+_COLLAPSE_STRINGS_AFTER = 80
+
+# Icon for steps whose node does not set one
+_DEFAULT_ICON = "⚡"
+
+# Step keys shown in the collapsed summary line rather than the details list
+_SUMMARY_KEYS = frozenset(("icon", "label", "status"))
+
+# Status message icon per node status
+_STATUS_EMOJI = MappingProxyType(
+    {
+        "pending": "⏳",
+        "running": "▶️",
+        "completed": "✅",
+        "error": "❌",
+        "skipped": "⏭️",
+    }
+)
+
+# Read-only fallback for missing mappings
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Placeholders shown before the workflow has any data
+_NO_WORKFLOW = {"message": "No workflow data available"}
+_NO_WORKFLOW_STATUS = "**Status:** No workflow data available"
+
+
+def create_workflow_visualizer() -> tuple[gr.HTML, gr.Markdown]:
     """
     Create a simple workflow visualizer using Gradio's built-in components.
 
-    Returns a tuple of (JSON component for graph data, Markdown component for current status).
+    Returns a tuple of (HTML component for the step timeline, Markdown component for current status).
 
-    Note: This is a simplified version using JSON display. For production,
-    consider creating a custom Gradio component with React Flow.
+    The timeline is fed by ``render_workflow_html``: every step is a ``<details>``
+    element and only the newest ones start open, so long runs do not re-render a
+    fully expanded JSON tree on every update.
     """
 
-    # Workflow graph data display
-    workflow_json = gr.JSON(
+    # Workflow step timeline
+    workflow_html = gr.HTML(
         label="Workflow Graph",
         elem_id="workflow_graph",
     )
@@ -26,7 +63,7 @@ def create_workflow_visualizer() -> tuple[gr.JSON, gr.Markdown]:
     # Current step status
     workflow_status = gr.Markdown(value="**Status:** Ready to start", elem_id="workflow_status")
 
-    return workflow_json, workflow_status
+    return workflow_html, workflow_status
 
 
 def format_workflow_for_display(workflow_data: dict[str, Any]) -> dict[str, Any]:
@@ -40,48 +77,133 @@ def format_workflow_for_display(workflow_data: dict[str, Any]) -> dict[str, Any]
         Formatted workflow data optimized for display
     """
     if not workflow_data:
-        return {"message": "No workflow data available"}
+        return _NO_WORKFLOW
 
-    # Create a more readable structure
-    formatted: dict[str, Any] = {
+    nodes = workflow_data.get("nodes") or ()
+    metadata = workflow_data.get("metadata") or _EMPTY
+
+    # Create a more readable structure, converting nodes to a timeline-style format
+    return {
         "summary": {
-            "total_nodes": workflow_data.get("metadata", {}).get("total_nodes", 0),
-            "total_edges": workflow_data.get("metadata", {}).get("total_edges", 0),
-            "depth": workflow_data.get("metadata", {}).get("depth", 0),
+            "total_nodes": metadata.get("total_nodes", 0),
+            "total_edges": metadata.get("total_edges", 0),
+            "depth": metadata.get("depth", 0),
         },
-        "steps": [],
+        "steps": [_format_step(node) for node in nodes],
+    }
+
+
+def _format_step(node: dict[str, Any]) -> dict[str, Any]:
+    """Convert one workflow node into a timeline step."""
+    node_data = node.get("data") or _EMPTY
+    get = node_data.get
+    node_type = node.get("type")
+    step = {
+        "id": node.get("id"),
+        "type": node_type,
+        "label": get("label"),
+        "status": get("status"),
+    }
+
+    # Default-valued fields are left out to keep the payload small; the
+    # renderer falls back to the defaults for missing keys
+    if (icon := get("icon")) and icon != _DEFAULT_ICON:
+        step["icon"] = icon
+    if (duration := get("duration")) and duration > 0:
+        step["duration_ms"] = duration
+
+    # Add type-specific details
+    handler = _TYPE_HANDLERS.get(node_type)
+    if handler is not None:
+        step.update(handler(node_data))
+
+    return step
+
+
+def _format_action(node_data: Mapping[str, Any]) -> dict[str, Any]:
+    details = {"action": node_data.get("action")}
+    if params := node_data.get("params"):
+        details["params"] = params
+    return details
+
+
+def _format_thinking(node_data: Mapping[str, Any]) -> dict[str, Any]:
+    return {"content": node_data.get("content")}
+
+
+def _format_result(node_data: Mapping[str, Any]) -> dict[str, Any]:
+    return {"result": node_data.get("result") or node_data.get("error")}
+
+
+# Type-specific step details, keyed by node type
+_TYPE_HANDLERS: Mapping[str, Callable[[Mapping[str, Any]], dict[str, Any]]] = MappingProxyType(
+    {
+        "action": _format_action,
+        "thinking": _format_thinking,
+        "result": _format_result,
+        "error": _format_result,
     }
+)
+
+
+def render_workflow_html(formatted: dict[str, Any], expanded_steps: int = EXPANDED_STEPS) -> str:
+    """
+    Render formatted workflow data as a collapsible HTML timeline.
+
+    Args:
+        formatted: Output of ``format_workflow_for_display``
+        expanded_steps: Number of most recent steps to render expanded
 
-    # Convert nodes to a timeline-style format
-    nodes = workflow_data.get("nodes", [])
-    for node in nodes:
-        node_data = node.get("data", {})
-        step = {
-            "id": node.get("id"),
-            "type": node.get("type"),
-            "label": node_data.get("label"),
-            "status": node_data.get("status"),
-            "icon": node_data.get("icon", "⚡"),
-        }
-
-        # Add duration if available
-        if "duration" in node_data:
-            step["duration_ms"] = node_data["duration"]
-
-        # Add type-specific details
-        if node.get("type") == "action":
-            step["action"] = node_data.get("action")
-            step["params"] = node_data.get("params", {})
-        elif node.get("type") == "thinking":
-            step["content"] = node_data.get("content")
-        elif node.get("type") in ("result", "error"):
-            step["result"] = node_data.get("result") or node_data.get("error")
-
-        steps = formatted.get("steps")
-        if isinstance(steps, list):
-            steps.append(step)
-
-    return formatted
+    Returns:
+        HTML string for the workflow visualizer
+    """
+    steps = formatted.get("steps")
+    if steps is None:
+        return f"<p>{html.escape(str(formatted.get('message', '')))}</p>"
+
+    summary = formatted.get("summary", {})
+    parts = [
+        '<div class="workflow-summary">',
+        f"{summary.get('total_nodes', 0)} nodes · {summary.get('total_edges', 0)} edges · "
+        f"depth {summary.get('depth', 0)}",
+        "</div>",
+    ]
+    first_open = len(steps) - expanded_steps
+    parts.extend(_render_step_html(step, index >= first_open) for index, step in enumerate(steps))
+    return "".join(parts)
+
+
+def _render_step_html(step: dict[str, Any], is_open: bool) -> str:
+    """Render one timeline step as a ``<details>`` element."""
+    details = "".join(
+        f"<dt>{html.escape(key)}</dt><dd>{_format_step_value(value)}</dd>"
+        for key, value in step.items()
+        if key not in _SUMMARY_KEYS
+    )
+    return "".join(
+        (
+            '<details class="workflow-step" open>'
+            if is_open
+            else '<details class="workflow-step">',
+            "<summary>",
+            html.escape(str(step.get("icon") or _DEFAULT_ICON)),
+            " ",
+            html.escape(str(step.get("label") or step.get("type") or "Step")),
+            ' <span class="workflow-step-status">',
+            html.escape(str(step.get("status") or "")),
+            "</span></summary><dl>",
+            details,
+            "</dl></details>",
+        )
+    )
+
+
+def _format_step_value(value: Any) -> str:
+    """Format a step value as escaped text, shortening long values."""
+    text = value if isinstance(value, str) else orjson.dumps(value, default=str).decode()
+    if len(text) > _COLLAPSE_STRINGS_AFTER:
+        text = text[:_COLLAPSE_STRINGS_AFTER] + "…"
+    return html.escape(text)
 
 
 def generate_workflow_status_markdown(workflow_data: dict[str, Any]) -> str:
@@ -95,33 +217,25 @@ def generate_workflow_status_markdown(workflow_data: dict[str, Any]) -> str:
         Markdown-formatted status string
     """
     if not workflow_data or not workflow_data.get("nodes"):
-        return "**Status:** No workflow data available"
+        return _NO_WORKFLOW_STATUS
 
-    nodes = workflow_data.get("nodes", [])
-    metadata = workflow_data.get("metadata", {})
+    nodes = workflow_data["nodes"]
+    metadata = workflow_data.get("metadata") or _EMPTY
 
     # Find current (last) node
-    current_node = nodes[-1] if nodes else None
+    current_node = nodes[-1]
 
     if not current_node:
         return "**Status:** Ready to start"
 
-    node_data = current_node.get("data", {})
+    node_data = current_node.get("data") or _EMPTY
     status = node_data.get("status", "unknown")
     label = node_data.get("label", "Step")
     # icon is not currently used but kept for future extensibility
-    _ = node_data.get("icon", "⚡")
+    _ = node_data.get("icon", _DEFAULT_ICON)
 
     # Build status message
-    status_emoji = {
-        "pending": "⏳",
-        "running": "▶️",
-        "completed": "✅",
-        "error": "❌",
-        "skipped": "⏭️",
-    }
-
-    status_icon = status_emoji.get(status, "•")
+    status_icon = _STATUS_EMOJI.get(status, "•")
 
     message = f"{status_icon} **{label}**"
 
@@ -130,8 +244,8 @@ def generate_workflow_status_markdown(workflow_data: dict[str, Any]) -> str:
         action = node_data.get("action", "")
         message += f" - {action}"
     elif current_node.get("type") == "thinking":
-        content = node_data.get("content", "")[:50]
-        message += f" - {content}..."
+        content = node_data.get("content", "")
+        message += f" - {content[:50]}..." if len(content) > 50 else f" - {content}"
 
     # Add progress
     total_nodes = metadata.get("total_nodes", 0)
@@ -146,8 +260,9 @@ def generate_workflow_status_markdown(workflow_data: dict[str, Any]) -> str:
     return message
 
 
-# CSS for workflow visualization
-WORKFLOW_CSS = """
+# CSS for workflow visualization, minified once at import
+WORKFLOW_CSS = minify_css(
+    """
 /* Workflow visualization styling */
 #workflow_graph {
     max-height: 600px;
@@ -167,21 +282,31 @@ WORKFLOW_CSS = """
     font-size: 1.1em;
 }
 
-/* Make JSON display more readable */
-#workflow_graph .json-node {
+/* Collapsible step timeline */
+#workflow_graph .workflow-summary {
+    font-weight: 600;
+    margin-bottom: 8px;
+}
+
+#workflow_graph .workflow-step {
     margin: 4px 0;
+    border-left: 2px solid rgba(102, 126, 234, 0.4);
+    padding-left: 8px;
 }
 
-#workflow_graph .json-key {
-    color: #667eea;
-    font-weight: 600;
+#workflow_graph .workflow-step-status {
+    opacity: 0.7;
+    font-size: 0.9em;
 }
 
-#workflow_graph .json-string {
-    color: #22863a;
+#workflow_graph dt {
+    color: #667eea;
+    font-weight: 600;
 }
 
-#workflow_graph .json-number {
-    color: #005cc5;
+#workflow_graph dd {
+    margin: 0 0 4px 12px;
+    word-break: break-word;
 }
 """
+)
@@ -1,18 +1,20 @@
+from __future__ import annotations
+
 import asyncio
 import json
 import os
 import shutil
-import time
+from collections import deque
+from collections.abc import Coroutine, Iterable, Mapping
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar
 
 import gradio as gr
-from browser_use.agent.service import Agent
+import orjson
 from gradio.components import Component
 
-from src.web_ui.agent.deep_research.deep_research_agent import DeepResearchAgent
-from src.web_ui.browser.custom_browser import CustomBrowser
-from src.web_ui.browser.custom_context import CustomBrowserContext
-from src.web_ui.controller.custom_controller import CustomController
 from src.web_ui.utils.config import (
     DEFAULT_SETTINGS_FILE,
     OLD_SETTINGS_DIR,
@@ -21,20 +23,85 @@ from src.web_ui.utils.config import (
     is_runtime_component,
 )
 
+# Only needed for annotations; importing them pulls in browser_use, playwright and LLM SDKs
+if TYPE_CHECKING:
+    from browser_use.agent.service import Agent
+
+    from src.web_ui.agent.deep_research.deep_research_agent import DeepResearchAgent
+    from src.web_ui.browser.custom_browser import CustomBrowser
+    from src.web_ui.browser.custom_context import CustomBrowserContext
+    from src.web_ui.controller.custom_controller import CustomController
+
+_NO_FROZEN_IDS: Mapping[str, Component] = MappingProxyType({})
+# Shared by every save; non-ASCII values are written as-is, so files are opened as UTF-8
+_SETTINGS_ENCODER = json.JSONEncoder(indent=4, ensure_ascii=False)
+
 
 class WebuiManager:
+    # Settings directories already created in this process
+    _dirs_ensured: ClassVar[set[str]] = set()
+
+    # Every instance attribute, including the agent state set by the init_* methods
+    __slots__ = (
+        "id_to_component",
+        "component_to_id",
+        "alias_map",
+        "_frozen_ids",
+        "_provider_ids",
+        "_saveable_ids",
+        "_components_cache",
+        "settings_save_dir",
+        "settings_panel_visible",
+        "current_agent_type",
+        "recent_tasks",
+        "token_used",
+        "token_cost",
+        "bu_agent",
+        "bu_browser",
+        "bu_browser_context",
+        "bu_controller",
+        "bu_chat_history",
+        "bu_response_event",
+        "bu_user_help_response",
+        "bu_current_task",
+        "bu_agent_task_id",
+        "bu_close_task",
+        "dr_agent",
+        "dr_current_task",
+        "dr_agent_task_id",
+        "dr_task_id",
+        "dr_save_dir",
+    )
+
     def __init__(self, settings_save_dir: str = SETTINGS_ARCHIVE_DIR):
         self.id_to_component: dict[str, Component] = {}
-        self.component_to_id: dict[Component, str] = {}
+        # Keyed by id(component); the components stay alive in id_to_component
+        self.component_to_id: dict[int, str] = {}
+        # Legacy component IDs resolved to their canonical registration
+        self.alias_map: dict[str, str] = {}
+        # Read-only id -> component snapshot with aliases resolved, built by finalize()
+        self._frozen_ids: Mapping[str, Component] = _NO_FROZEN_IDS
+        # Ids (including aliases) of provider dropdowns whose model list follows them
+        self._provider_ids: list[str] = []
+        # Components save_config persists, derived from the registry on first save
+        self._saveable_ids: tuple[tuple[int, str], ...] | None = None
+        # Registration-ordered components, built on the first get_components() call
+        self._components_cache: tuple[Component, ...] | None = None
 
         self.settings_save_dir = settings_save_dir
-        ensure_settings_directories()
+        if settings_save_dir not in WebuiManager._dirs_ensured:
+            ensure_settings_directories()
+            os.makedirs(settings_save_dir, exist_ok=True)
+            WebuiManager._dirs_ensured.add(settings_save_dir)
 
         # Dashboard state management
         self.settings_panel_visible: bool = False
         self.current_agent_type: str = "browser_use"  # "browser_use" or "deep_research"
-        self.recent_tasks: list[dict] = []  # List of recent task executions
-        self.token_usage: dict = {"used": 0, "cost": 0.0}  # Token usage tracking
+        # Recent task executions; the deque drops the oldest beyond 20
+        self.recent_tasks: deque[dict] = deque(maxlen=20)
+        # Token usage tracking
+        self.token_used: int = 0
+        self.token_cost: float = 0.0
 
     def init_browser_use_agent(self) -> None:
         """
@@ -49,6 +116,7 @@ class WebuiManager:
         self.bu_user_help_response: str | None = None
         self.bu_current_task: asyncio.Task | None = None
         self.bu_agent_task_id: str | None = None
+        self.bu_close_task: asyncio.Task | None = None
 
     def init_deep_research_agent(self) -> None:
         """
@@ -60,32 +128,97 @@ class WebuiManager:
         self.dr_task_id: str | None = None
         self.dr_save_dir: str | None = None
 
+    @staticmethod
+    def start_agent_task(coro: Coroutine) -> asyncio.Task:
+        """
+        Start an agent run as a task that executes inline up to its first real
+        suspension point (Python 3.12+). Only this task starts eagerly; the server
+        loop's task factory is left alone.
+        """
+        if hasattr(asyncio, "eager_task_factory"):
+            return asyncio.eager_task_factory(asyncio.get_running_loop(), coro)
+        return asyncio.create_task(coro)
+
     def add_components(self, tab_name: str, components_dict: dict[str, Component]) -> None:
         """
         Add tab components
         """
+        self._frozen_ids = _NO_FROZEN_IDS
+        self._saveable_ids = None
+        self._components_cache = None
         for comp_name, component in components_dict.items():
             comp_id = f"{tab_name}.{comp_name}"
             self.id_to_component[comp_id] = component
-            self.component_to_id[component] = comp_id
+            self.component_to_id[id(component)] = comp_id
+            if comp_name.endswith("llm_provider"):
+                self._provider_ids.append(comp_id)
+
+    def add_aliases(self, canonical: str, alias: str, keys: Iterable[str]) -> None:
+        """
+        Expose components registered under `canonical` as `alias.<key>` without re-registering
+        """
+        self._frozen_ids = _NO_FROZEN_IDS
+        for key in keys:
+            self.alias_map[f"{alias}.{key}"] = f"{canonical}.{key}"
+            if key.endswith("llm_provider"):
+                self._provider_ids.append(f"{alias}.{key}")
+
+    def finalize(self) -> None:
+        """
+        Snapshot the registry so id lookups, including aliases, take a single dict hit.
+        Registering more components or aliases afterwards drops the snapshot.
+        """
+        id_to_component = self.id_to_component
+        lookup = dict(id_to_component)
+        for alias, canonical in self.alias_map.items():
+            if canonical in id_to_component:
+                lookup[alias] = id_to_component[canonical]
+        self._frozen_ids = MappingProxyType(lookup)
 
     def get_components(self) -> list[Component]:
         """
         Get all components
         """
-        return list(self.id_to_component.values())
+        components = self._components_cache
+        if components is None:
+            components = self._components_cache = tuple(self.id_to_component.values())
+        # Fresh list each call so callers may mutate it
+        return list(components)
 
     def get_component_by_id(self, comp_id: str) -> Component:
         """
         Get component by id
         """
-        return self.id_to_component[comp_id]
+        comp = self._frozen_ids.get(comp_id)
+        if comp is None:
+            comp = self.id_to_component[self.alias_map.get(comp_id, comp_id)]
+        return comp
+
+    def get_components_by_ids(self, comp_ids: Iterable[str]) -> list[Component]:
+        """
+        Get several components by id in one pass, in the order given
+        """
+        if self._frozen_ids:
+            frozen_ids = self._frozen_ids
+            return [frozen_ids[comp_id] for comp_id in comp_ids]
+        id_to_component = self.id_to_component
+        alias_get = self.alias_map.get
+        return [id_to_component[alias_get(comp_id, comp_id)] for comp_id in comp_ids]
+
+    def find_component_by_id(self, comp_id: str) -> Component | None:
+        """
+        Get component by id, or None if it is not registered
+        """
+        comp = self._frozen_ids.get(comp_id)
+        if comp is None:
+            comp = self.id_to_component.get(self.alias_map.get(comp_id, comp_id))
+        return comp
 
     def get_id_by_component(self, comp: Component) -> str:
         """
         Get id by component
         """
-        return self.component_to_id[comp]
+        return self.component_to_id[id(comp)]
 
     def save_config(self, *args, as_default: bool = False) -> str:
         """
@@ -98,103 +231,104 @@ class WebuiManager:
         Returns:
             Path to saved config file
         """
-        # Convert args to components dict
-        components = {}
-        all_components = list(self.id_to_component.values())
-        for i, comp in enumerate(all_components):
-            if i < len(args):
-                components[comp] = args[i]
-
-        cur_settings = {}
-        for comp in components:
-            if (
-                not isinstance(comp, gr.Button)
-                and not isinstance(comp, gr.File)
-                and str(getattr(comp, "interactive", True)).lower() != "false"
-            ):
-                comp_id = self.get_id_by_component(comp)
-                # Filter out runtime-only components
-                if not is_runtime_component(comp_id):
-                    cur_settings[comp_id] = components[comp]
+        # Args arrive in registration order, so saveable ids map to fixed positions
+        saveable_ids = self._saveable_ids
+        if saveable_ids is None:
+            saveable_ids = self._saveable_ids = self._build_saveable_ids()
+        arg_count = len(args)
+        cur_settings = {comp_id: args[i] for i, comp_id in saveable_ids if i < arg_count}
 
         if as_default:
             config_path = DEFAULT_SETTINGS_FILE
         else:
-            config_name = datetime.now().strftime("%Y%m%d-%H%M%S")
-            config_path = os.path.join(self.settings_save_dir, f"{config_name}.json")
+            config_path = os.path.join(
+                self.settings_save_dir, f"{datetime.now():%Y%m%d-%H%M%S}.json"
+            )
 
-        with open(config_path, "w") as fw:
-            json.dump(cur_settings, fw, indent=4)
+        # Encode first so the file is written in one call instead of one per token
+        with open(config_path, "w", encoding="utf-8") as fw:
+            fw.write(_SETTINGS_ENCODER.encode(cur_settings))
 
         return config_path
 
-    def load_config(self, config_path: str):
+    def _build_saveable_ids(self) -> tuple[tuple[int, str], ...]:
+        """
+        (position, id) of every registered component whose value belongs in a saved config
+        """
+        saveable = []
+        for i, (comp_id, comp) in enumerate(self.id_to_component.items()):
+            if isinstance(comp, (gr.Button, gr.File)):
+                continue
+            if str(getattr(comp, "interactive", True)).lower() == "false":
+                continue
+            # Filter out runtime-only components
+            if is_runtime_component(comp_id):
+                continue
+            saveable.append((i, comp_id))
+        return tuple(saveable)
+
+    async def load_config(self, config_path: str):
         """
         Load config
         """
-        with open(config_path) as fr:
-            ui_settings = json.load(fr)
+        ui_settings = orjson.loads(await asyncio.to_thread(Path(config_path).read_bytes))
 
         update_components = {}
+        find_component = self.find_component_by_id
         for comp_id, comp_val in ui_settings.items():
-            if comp_id in self.id_to_component:
-                comp = self.id_to_component[comp_id]
-                if comp.__class__.__name__ == "Chatbot":
-                    update_components[comp] = comp.__class__(value=comp_val, type="messages")
-                else:
-                    update_components[comp] = comp.__class__(value=comp_val)
-                    if comp_id == "agent_settings.planner_llm_provider":
-                        yield update_components  # yield provider, let callback run
-                        time.sleep(0.1)  # wait for Gradio UI callback
+            comp = find_component(comp_id)
+            if comp is not None:
+                update_components[comp] = gr.update(value=comp_val)
+                if comp_id == "agent_settings.planner_llm_provider":
+                    yield update_components  # yield provider, let callback run
+                    # Wait for the Gradio UI callback without holding a worker thread
+                    await asyncio.sleep(0.1)
 
         config_status = self.id_to_component["load_save_config.config_status"]
-        update_components.update(
-            {
-                config_status: config_status.__class__(
-                    value=f"Successfully loaded config: {config_path}"
-                )
-            }
+        update_components[config_status] = gr.update(
+            value=f"Successfully loaded config: {config_path}"
         )
         yield update_components
 
-    def load_default_settings(self) -> bool:
+    def read_default_settings(self) -> dict | None:
+        """
+        Read the default settings file, or return None if there is none.
+
+        Only touches the filesystem, so it can run off the thread building the UI.
+        """
+        if not os.path.exists(DEFAULT_SETTINGS_FILE):
+            return None
+        return orjson.loads(Path(DEFAULT_SETTINGS_FILE).read_bytes())
+
+    def load_default_settings(self, ui_settings: dict | None = None) -> bool:
         """
         Load default settings if they exist.
 
+        Args:
+            ui_settings: Settings already read with read_default_settings; read
+                from disk when omitted
+
         Returns:
             True if default settings were loaded, False otherwise
         """
-        if os.path.exists(DEFAULT_SETTINGS_FILE):
+        if ui_settings is not None or os.path.exists(DEFAULT_SETTINGS_FILE):
             try:
                 # Load default settings without showing status message
-                with open(DEFAULT_SETTINGS_FILE) as fr:
-                    ui_settings = json.load(fr)
-
-                update_components = {}
-                provider_changed = False
-                provider_value = None
+                if ui_settings is None:
+                    ui_settings = self.read_default_settings() or {}
 
+                # Apply values in place before the page is served (blocking update)
+                find_component = self.find_component_by_id
                 for comp_id, comp_val in ui_settings.items():
-                    if comp_id in self.id_to_component:
-                        comp = self.id_to_component[comp_id]
-                        if comp.__class__.__name__ == "Chatbot":
-                            update_components[comp] = comp.__class__(
-                                value=comp_val, type="messages"
-                            )
-                        else:
-                            update_components[comp] = comp.__class__(value=comp_val)
-
-                        # Track if provider changed to trigger model dropdown update
-                        if "llm_provider" in comp_id:
-                            provider_changed = True
-                            provider_value = comp_val
-
-                # Apply updates without yielding (blocking update)
-                for comp, val in update_components.items():
-                    comp.value = val
-
-                # Manually trigger provider change to update model dropdown
-                if provider_changed and provider_value:
+                    comp = find_component(comp_id)
+                    if comp is not None:
+                        comp.value = comp_val
+
+                # Manually trigger provider change to update each provider's model dropdown
+                for provider_id in self._provider_ids:
+                    provider_value = ui_settings.get(provider_id)
+                    if not provider_value:
+                        continue
                     try:
                         # Import here to avoid circular dependencies
                         from src.web_ui.webui.components.dashboard_settings import (
@@ -204,11 +338,12 @@ class WebuiManager:
                         # Update model dropdown for the provider
                         model_update = update_model_dropdown(provider_value)
 
-                        # Find and update the model component
-                        model_comp_id = comp_id.replace("llm_provider", "llm_model_name")
-                        if model_comp_id in self.id_to_component:
-                            model_comp = self.id_to_component[model_comp_id]
-                            model_comp.value = model_update.get("value", "")
+                        # Find and update the model component, keeping a saved model choice
+                        model_comp_id = provider_id.replace("llm_provider", "llm_model_name")
+                        model_comp = self.find_component_by_id(model_comp_id)
+                        if model_comp is not None:
+                            if model_comp_id not in ui_settings:
+                                model_comp.value = model_update.get("value", "")
                             # Also update choices if available
                             if "choices" in model_update:
                                 model_comp.choices = model_update["choices"]
@@ -244,11 +379,21 @@ class WebuiManager:
         migrated_count = 0
         if os.path.exists(OLD_SETTINGS_DIR):
             try:
-                for filename in os.listdir(OLD_SETTINGS_DIR):
-                    if filename.endswith(".json"):
-                        src = os.path.join(OLD_SETTINGS_DIR, filename)
-                        dst = os.path.join(self.settings_save_dir, filename)
-                        shutil.copy2(src, dst)
+                with os.scandir(OLD_SETTINGS_DIR) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".json") or not entry.is_file():
+                            continue
+                        dst = os.path.join(self.settings_save_dir, entry.name)
+                        # Hardlink on the same filesystem; copy across devices or over
+                        # an existing file. A link left by an earlier run is already done.
+                        try:
+                            os.link(entry.path, dst)
+                        except FileExistsError:
+                            if os.path.samefile(entry.path, dst):
+                                continue
+                            shutil.copy2(entry.path, dst)
+                        except OSError:
+                            shutil.copy2(entry.path, dst)
                         migrated_count += 1
                 print(f"Migrated {migrated_count} settings files from {OLD_SETTINGS_DIR}")
             except Exception as e:
@@ -274,21 +419,15 @@ class WebuiManager:
             success: Whether the task completed successfully
             result: Optional result summary
         """
-        from datetime import datetime
-
         task_entry = {
             "task": task,
             "success": success,
             "result": result,
-            "timestamp": datetime.now().strftime("%H:%M:%S"),
+            "timestamp": f"{datetime.now():%H:%M:%S}",
         }
 
         self.recent_tasks.append(task_entry)
 
-        # Keep only last 20 tasks
-        if len(self.recent_tasks) > 20:
-            self.recent_tasks = self.recent_tasks[-20:]
-
     def update_token_usage(self, tokens: int, cost: float = 0.0) -> None:
         """
         Update token usage statistics.
@@ -297,12 +436,13 @@ class WebuiManager:
             tokens: Number of tokens used
             cost: Estimated cost in USD
         """
-        self.token_usage["used"] += tokens
-        self.token_usage["cost"] += cost
+        self.token_used += tokens
+        self.token_cost += cost
 
     def reset_token_usage(self) -> None:
         """Reset token usage statistics."""
-        self.token_usage = {"used": 0, "cost": 0.0}
+        self.token_used = 0
+        self.token_cost = 0.0
 
     def get_status_summary(self) -> dict:
         """
@@ -316,5 +456,5 @@ class WebuiManager:
             "current_agent": self.current_agent_type,
             "browser_open": bool(self.bu_browser),
             "recent_task_count": len(self.recent_tasks),
-            "token_usage": self.token_usage,
+            "token_usage": {"used": self.token_used, "cost": self.token_cost},
         }
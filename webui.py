@@ -1,5 +1,7 @@
 import argparse
+import asyncio
 import logging
+import os
 import signal
 import socket
 import sys
@@ -7,47 +9,95 @@ from contextlib import closing
 
 from dotenv import load_dotenv
 
-from src.web_ui.webui.interface import create_ui, theme_map
+from src.web_ui.utils.config import THEME_NAMES
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+_RULE = "=" * 70
+
+
+def _probe_socket(host: str) -> socket.socket:
+    """Create a socket of the host's address family for bind() probes of port availability."""
+    family = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)[0][0]
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    # Binding fails immediately when the port is taken, unlike a connect that can
+    # hang on a firewalled host. SO_REUSEADDR ignores TIME_WAIT leftovers, but on
+    # Windows it would let us bind over a live listener, so ask for exclusive use there.
+    if os.name == "nt":
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+    else:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    return sock
+
 
 def is_port_available(host: str, port: int) -> bool:
     """Check if a port is available on the given host."""
     try:
-        with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
-            sock.settimeout(1)
-            result = sock.connect_ex((host, port))
-            return result != 0  # Port is available if connection failed
-    except Exception:
+        with closing(_probe_socket(host)) as sock:
+            sock.bind((host, port))
+            return True
+    except OSError:
         return False
 
 
-def find_available_port(host: str, start_port: int, max_attempts: int = 10) -> int:
-    """Find an available port starting from start_port."""
-    for port in range(start_port, start_port + max_attempts):
-        if is_port_available(host, port):
+def setup_signal_handlers(loop: asyncio.AbstractEventLoop) -> asyncio.Event:
+    """Setup graceful shutdown handlers; the returned event is set on SIGINT/SIGTERM."""
+    shutdown = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, shutdown.set)
+        except NotImplementedError:
+            # Windows event loops have no add_signal_handler
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(shutdown.set))
+    return shutdown
+
+
+def launch_on_first_free_port(demo, ports: range, **launch_kwargs) -> int:
+    """Launch the UI without blocking on the first port Gradio manages to bind."""
+    # Letting the bind itself decide avoids a check-then-bind race on the port
+    for port in ports:
+        try:
+            demo.launch(server_port=port, prevent_thread_lock=True, **launch_kwargs)
             return port
-    raise OSError(
-        f"Could not find an available port in range {start_port}-{start_port + max_attempts - 1}"
+        except OSError as e:
+            logger.debug("Port %s unavailable: %s", port, e)
+    raise OSError(f"Could not find an available port in range {ports[0]}-{ports[-1]}")
+
+
+def print_banner(host: str, port: int) -> None:
+    """Print where the server is reachable and a few usage tips."""
+    local_access = f"   Local access: http://localhost:{port}\n" if host == "127.0.0.1" else ""
+    # Written in one call rather than a print (and stdout lock) per line
+    sys.stdout.write(
+        f"\n{_RULE}\n"
+        f"✅ Server running at: http://{host}:{port}\n"
+        f"{local_access}"
+        f"{_RULE}\n"
+        "\n💡 Quick Tips:\n"
+        "   • Press Ctrl+C to stop the server\n"
+        "   • Press '?' in the UI to see keyboard shortcuts\n"
+        "   • Check the Quick Start tab for preset configurations\n"
+        "\n📚 Documentation: https://github.com/savagelysubtle/web-ui-1\n"
+        f"{'-' * 70}\n\n"
     )
+    sys.stdout.flush()
 
 
-def setup_signal_handlers(demo):
-    """Setup graceful shutdown handlers."""
+async def serve(demo, ports: range, **launch_kwargs) -> None:
+    """Launch the UI and close it once a shutdown signal arrives."""
+    shutdown = setup_signal_handlers(asyncio.get_running_loop())
+    demo.queue()
+    port = launch_on_first_free_port(demo, ports, **launch_kwargs)
+    print_banner(launch_kwargs["server_name"], port)
+    await shutdown.wait()
 
-    def signal_handler(sig, frame):
-        print("\n🛑 Shutting down gracefully...")
-        try:
-            demo.close()
-        except Exception as e:
-            logger.error(f"Error during shutdown: {e}")
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    print("\n🛑 Shutting down gracefully...")
+    try:
+        demo.close()
+    except Exception as e:
+        logger.error("Error during shutdown: %s", e)
 
 
 def main():
@@ -71,7 +121,7 @@ Examples:
         "--theme",
         type=str,
         default="Ocean",
-        choices=theme_map.keys(),
+        choices=THEME_NAMES,
         help="Theme to use for the UI (default: Ocean)",
     )
     parser.add_argument(
@@ -87,77 +137,63 @@ Examples:
 
     # Configure logging
     log_level = logging.DEBUG if args.debug else logging.INFO
+    # force=True replaces any handlers a dependency installed on import
     logging.basicConfig(
-        level=log_level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        level=log_level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        force=True,
     )
+    # httpx logs every request at INFO, which floods the output under load
+    logging.getLogger("httpx").setLevel(logging.WARNING)
 
-    print("\n" + "=" * 70)
-    print("🌐 Browser Use WebUI - AI-Powered Browser Automation")
-    print("=" * 70)
+    print(f"\n{_RULE}\n🌐 Browser Use WebUI - AI-Powered Browser Automation\n{_RULE}")
 
-    # Check if port is available
+    # Check if port is available; with --auto-port the launch itself probes ports instead
     selected_port = args.port
-    if not is_port_available(args.ip, selected_port):
-        if args.auto_port:
-            print(f"⚠️  Port {selected_port} is already in use, finding alternative...")
-            try:
-                selected_port = find_available_port(args.ip, selected_port + 1)
-                print(f"✅ Found available port: {selected_port}")
-            except OSError as e:
-                print(f"❌ Error: {e}")
-                print("\n💡 Try one of these:")
-                print(f"   - Stop the process using port {args.port}")
-                print("   - Use a different port: python webui.py --port 8080")
-                print("   - Use --auto-port flag to find available port automatically")
-                sys.exit(1)
-        else:
-            print(f"❌ Error: Port {selected_port} is already in use!")
-            print("\n💡 Try one of these:")
-            print(f"   1. Stop the existing process on port {selected_port}")
-            print("   2. Use a different port: python webui.py --port 8080")
-            print("   3. Use auto-port selection: python webui.py --auto-port")
-            sys.exit(1)
+    if not args.auto_port and not is_port_available(args.ip, selected_port):
+        print(f"❌ Error: Port {selected_port} is already in use!")
+        print("\n💡 Try one of these:")
+        print(f"   1. Stop the existing process on port {selected_port}")
+        print("   2. Use a different port: python webui.py --port 8080")
+        print("   3. Use auto-port selection: python webui.py --auto-port")
+        sys.exit(1)
+    # The requested port first, then the next 10 when --auto-port allows it
+    ports = range(selected_port, selected_port + (11 if args.auto_port else 1))
 
     try:
-        print("\n🚀 Starting server...")
-        print(f"   • Theme: {args.theme}")
-        print(f"   • Host: {args.ip}")
-        print(f"   • Port: {selected_port}")
-        if args.share:
-            print("   • Share: Enabled (public link will be generated)")
-
-        # Create and launch the UI
+        port_note = " (or next free)" if args.auto_port else ""
+        share_line = "\n   • Share: Enabled (public link will be generated)" if args.share else ""
+        print(
+            "\n🚀 Starting server...\n"
+            f"   • Theme: {args.theme}\n"
+            f"   • Host: {args.ip}\n"
+            f"   • Port: {selected_port}{port_note}"
+            f"{share_line}"
+        )
+
+        # Create and launch the UI; Gradio and the agent stack load only from here on,
+        # so --help and port errors return without importing them
+        from src.web_ui.webui.interface import create_ui
+
         demo = create_ui(theme_name=args.theme)
 
-        # Setup graceful shutdown
-        setup_signal_handlers(demo)
-
-        print("\n" + "=" * 70)
-        print(f"✅ Server running at: http://{args.ip}:{selected_port}")
-        if args.ip == "127.0.0.1":
-            print(f"   Local access: http://localhost:{selected_port}")
-        print("=" * 70)
-        print("\n💡 Quick Tips:")
-        print("   • Press Ctrl+C to stop the server")
-        print("   • Press '?' in the UI to see keyboard shortcuts")
-        print("   • Check the Quick Start tab for preset configurations")
-        print("\n📚 Documentation: https://github.com/savagelysubtle/web-ui-1")
-        print("-" * 70 + "\n")
-
-        # Launch with error handling
-        demo.queue().launch(
-            server_name=args.ip,
-            server_port=selected_port,
-            share=args.share,
-            show_error=True,
-            quiet=False,
+        # Launch with error handling; runs until SIGINT/SIGTERM
+        asyncio.run(
+            serve(
+                demo,
+                ports,
+                server_name=args.ip,
+                share=args.share,
+                show_error=True,
+                quiet=False,
+            )
         )
 
     except KeyboardInterrupt:
         print("\n🛑 Shutting down gracefully...")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Failed to start server: {e}", exc_info=args.debug)
+        logger.error("Failed to start server: %s", e, exc_info=args.debug)
         print(f"\n❌ Error starting server: {e}")
         if not args.debug:
             print("💡 Run with --debug flag for detailed error information")